@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.aio`
+================================================
+asyncio wrappers for `MCP3xxx`_ and `AnalogIn`_.
+
+Blocking SPI transfers run in an executor so they do not stall the event loop, and
+each chip is guarded by one `asyncio.Lock` so coroutines sampling different channels
+of the same chip never interleave frames. The transfer itself also holds a
+:class:`threading.Lock`, because a cancelled coroutine releases the `asyncio.Lock`
+while its transfer is still running in the executor.
+
+.. note:: This module needs ``loop.run_in_executor`` and is meant for CPython
+    (e.g. Blinka on a Raspberry Pi). It is not supported on CircuitPython.
+
+* Author(s): Adafruit Industries
+"""
+
+import asyncio
+import threading
+
+from .analog_in import AnalogIn
+from .mcp3xxx import MCP3xxx, _check_mcp
+
+try:
+    from array import array
+    from concurrent.futures import Executor
+    from typing import AsyncIterator, Callable, Optional, Sequence, TypeVar
+
+    _T = TypeVar("_T")
+except ImportError:
+    pass
+
+
+class AsyncMCP3xxx:
+    """Serializes access to one chip from many coroutines.
+
+    :param MCP3xxx mcp: the chip to wrap.
+    :param ~concurrent.futures.Executor executor: executor that runs the blocking
+        transfers. Defaults to the event loop's default executor.
+    """
+
+    def __init__(self, mcp: MCP3xxx, executor: Optional[Executor] = None) -> None:
+        _check_mcp(mcp)
+        self._mcp = mcp
+        self._executor = executor
+        # Created on first use so it binds to the loop that is actually running.
+        self._lock = None
+        self._transfer_lock = threading.Lock()
+
+    @property
+    def mcp(self) -> MCP3xxx:
+        """The wrapped chip. (read-only)"""
+        return self._mcp
+
+    async def run(self, func: Callable[..., _T], *args) -> _T:
+        """Run ``func(*args)`` in the executor while holding this chip's lock.
+
+        :param func: a blocking callable that talks to the chip.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._locked, func, args)
+
+    def _locked(self, func: Callable[..., _T], args: tuple) -> _T:
+        with self._transfer_lock:
+            return func(*args)
+
+    async def read(self, pin: int, is_differential: bool = False) -> int:
+        """Asynchronous `MCP3xxx.read`."""
+        return await self.run(self._mcp.read, pin, is_differential)
+
+    async def read_many(
+        self,
+        pins: Sequence[int],
+        buf: Optional[array] = None,
+        is_differential: bool = False,
+    ) -> array:
+        """Asynchronous `MCP3xxx.read_many`."""
+        return await self.run(self._mcp.read_many, pins, buf, is_differential)
+
+    async def read_into(
+        self,
+        pin: int,
+        buf: array,
+        count: Optional[int] = None,
+        is_differential: bool = False,
+    ) -> array:
+        """Asynchronous `MCP3xxx.read_into`."""
+        return await self.run(self._mcp.read_into, pin, buf, count, is_differential)
+
+    async def scan(self, buf: Optional[array] = None) -> array:
+        """Asynchronous `MCP3xxx.scan`."""
+        return await self.run(self._mcp.scan, buf)
+
+    def channel(self, positive_pin: int, negative_pin: Optional[int] = None) -> "AsyncAnalogIn":
+        """Returns an `AsyncAnalogIn` sharing this chip's lock.
+
+        :param int positive_pin: Required pin for single-ended.
+        :param int negative_pin: Optional pin for differential reads.
+        """
+        return AsyncAnalogIn(self, positive_pin, negative_pin)
+
+
+class AsyncAnalogIn:
+    """Asynchronous counterpart of `AnalogIn`_.
+
+    :param AsyncMCP3xxx amcp: the wrapped chip.
+    :param int positive_pin: Required pin for single-ended.
+    :param int negative_pin: Optional pin for differential reads.
+    """
+
+    def __init__(
+        self, amcp: AsyncMCP3xxx, positive_pin: int, negative_pin: Optional[int] = None
+    ) -> None:
+        self._amcp = amcp
+        self._chan = AnalogIn(amcp.mcp, positive_pin, negative_pin)
+
+    def _value(self) -> int:
+        return self._chan.value
+
+    def _voltage(self) -> float:
+        return self._chan.voltage
+
+    async def read(self) -> int:
+        """Returns `AnalogIn.value` without blocking the event loop."""
+        return await self._amcp.run(self._value)
+
+    async def read_voltage(self) -> float:
+        """Returns `AnalogIn.voltage` without blocking the event loop."""
+        return await self._amcp.run(self._voltage)
+
+    async def stream(self, rate: float, count: Optional[int] = None) -> AsyncIterator[int]:
+        """Yields `AnalogIn.value` samples at ``rate`` Hz on an absolute schedule, so
+        time spent by the consumer does not accumulate as drift. If the loop falls more
+        than one period behind, the schedule restarts from now instead of bursting.
+
+        :param float rate: samples per second.
+        :param int count: number of samples to yield. Streams forever if omitted.
+        """
+        period = 1 / rate
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        taken = 0
+        while count is None or taken < count:
+            yield await self.read()
+            taken += 1
+            deadline += period
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif delay < -period:
+                deadline = loop.time()
@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.alarm`
+================================================
+Window comparator alarms evaluated on raw codes.
+
+`AlarmMonitor` converts each channel's low and high limits from volts to raw codes once,
+using the chip's `MCP3xxx.reference_voltage` and `MCP3xxx.BITS`, so checking a scan only
+compares integers. A channel changes state after the new condition has held for
+``debounce`` consecutive scans, and each change sets its flag and calls the callback.
+
+.. code-block:: python
+
+    def on_alarm(pin, state, code):
+        print(pin, ("normal", "low", "high")[state], code)
+
+    alarms = AlarmMonitor(mcp, (0, 1), low=0.5, high=(3.0, 2.5), debounce=3, callback=on_alarm)
+    while True:
+        alarms.poll()
+
+* Author(s): Adafruit Industries
+"""
+
+from array import array
+
+from .mcp3xxx import MCP3xxx, _check_mcp
+
+try:
+    from typing import Callable, Optional, Sequence, Union
+
+    Limit = Optional[Union[float, Sequence[Optional[float]]]]
+except ImportError:
+    pass
+
+NORMAL = 0
+"""The reading is within its limits."""
+LOW = 1
+"""The reading is below its low limit."""
+HIGH = 2
+"""The reading is above its high limit."""
+
+
+def volts_to_code(volts: float, bits: int, reference_voltage: float) -> int:
+    """Returns the raw code a ``bits`` resolution chip reads for ``volts``, clamped to
+    its range.
+
+    :param float volts: the input voltage.
+    :param int bits: resolution of the chip, e.g. ``mcp.BITS``.
+    :param float reference_voltage: reference voltage of the chip.
+    """
+    full_scale = 1 << bits
+    code = int(volts * full_scale / reference_voltage)
+    return min(max(code, 0), full_scale - 1)
+
+
+def _per_pin(limit: Limit, count: int) -> list:
+    if limit is None or isinstance(limit, (int, float)):
+        return [limit] * count
+    if len(limit) != count:
+        raise ValueError("Provide one limit per pin.")
+    return list(limit)
+
+
+class AlarmMonitor:
+    """Checks every scan of ``pins`` against per-channel low and high limits.
+
+    :param MCP3xxx mcp: the chip to read.
+    :param pins: the pins to watch, in order.
+    :param low: low limit in volts, either one for all pins or one per pin. None
+        disables the limit.
+    :param high: high limit in volts, like ``low``.
+    :param int debounce: consecutive scans a new condition must hold before the channel
+        changes state.
+    :param callback: optional function called as ``callback(pin, state, code)`` whenever
+        a channel changes state to `NORMAL`, `LOW` or `HIGH`.
+    :param bool is_differential: single-ended or differential reads for all ``pins``.
+    """
+
+    def __init__(
+        self,
+        mcp: MCP3xxx,
+        pins: Sequence[int],
+        low: Limit = None,
+        high: Limit = None,
+        debounce: int = 1,
+        callback: Optional[Callable[[int, int, int], None]] = None,
+        is_differential: bool = False,
+    ) -> None:
+        _check_mcp(mcp)
+        if debounce < 1:
+            raise ValueError("debounce must be at least 1.")
+        count = len(pins)
+        self._mcp = mcp
+        self._pins = tuple(pins)
+        self._commands = mcp.pack_commands(pins, is_differential)
+        self._frame = array("H", bytes(2 * count))
+        self._low = array("h", bytes(2 * count))
+        self._high = array("h", bytes(2 * count))
+        self._pending = array("B", bytes(count))
+        self._counts = array("H", bytes(2 * count))
+        self.states = array("B", bytes(count))
+        """``array('B')`` holding the current state of each pin."""
+        self.debounce = debounce
+        self.callback = callback
+        lows = _per_pin(low, count)
+        highs = _per_pin(high, count)
+        for i in range(count):
+            self.set_limits(i, lows[i], highs[i])
+
+    def set_limits(self, index: int, low: Optional[float], high: Optional[float]) -> None:
+        """Change the limits of the pin at ``index`` in ``pins``.
+
+        :param int index: position of the pin in ``pins``.
+        :param float low: low limit in volts, or None to disable it.
+        :param float high: high limit in volts, or None to disable it.
+        """
+        bits = self._mcp.BITS
+        ref = self._mcp.reference_voltage
+        self._low[index] = -1 if low is None else volts_to_code(low, bits, ref)
+        self._high[index] = 1 << bits if high is None else volts_to_code(high, bits, ref)
+
+    @property
+    def active(self) -> bool:
+        """True while any pin is not `NORMAL`. (read-only)"""
+        return any(self.states)
+
+    def poll(self) -> int:
+        """Scan every pin once and `check` the result."""
+        return self.check(self._mcp.read_packed(self._commands, self._frame))
+
+    def check(self, frame: Sequence[int]) -> int:
+        """Evaluate one frame of raw codes, e.g. from a
+        `~adafruit_mcp3xxx.scheduler.SampleScheduler` already scanning ``pins``.
+
+        :param frame: one code per pin, in order.
+        :return: the number of pins that changed state.
+        """
+        low = self._low
+        high = self._high
+        states = self.states
+        pending = self._pending
+        counts = self._counts
+        debounce = self.debounce
+        changed = 0
+        for i, code in enumerate(frame):
+            if code < low[i]:
+                condition = LOW
+            elif code > high[i]:
+                condition = HIGH
+            else:
+                condition = NORMAL
+            if condition == states[i]:
+                counts[i] = 0
+                continue
+            if condition == pending[i] and counts[i]:
+                counts[i] += 1
+            else:
+                pending[i] = condition
+                counts[i] = 1
+            if counts[i] >= debounce:
+                states[i] = condition
+                counts[i] = 0
+                changed += 1
+                if self.callback is not None:
+                    self.callback(self._pins[i], condition, code)
+        return changed
@@ -18,10 +18,17 @@ differential ADC readings.
 
 """
 
+from array import array
+
 from .mcp3xxx import MCP3xxx
 
 try:
     from typing import Optional
+
+    from .cache import ReadCache
+    from .calibration import Calibration
+    from .deadband import Deadband
+    from .fixedpoint import FixedScale
 except ImportError:
     pass
 
@@ -32,9 +39,27 @@ class AnalogIn:
     :param MCP3002,MCP3004,MCP3008 mcp: The mcp object.
     :param int positive_pin: Required pin for single-ended.
     :param int negative_pin: Optional pin for differential reads.
+    :param int oversample: Optional number of conversions averaged into each reading. They
+        are taken back-to-back in one bus transaction. Oversampling by ``4 ** n`` adds ``n``
+        bits of resolution, up to the full 16 bits of `value`.
+    :param Deadband deadband: Optional deadband used by `poll`. Its thresholds are in LSBs
+        of the chip's resolution plus any bits gained by oversampling.
+    :param Calibration calibration: Optional calibration applied by `voltage`. Its
+        ``bits`` must match the chip's resolution plus any bits gained by oversampling.
+    :param ReadCache cache: Optional cache of ``mcp`` to serve readings from. Cannot be
+        combined with ``oversample``.
     """
 
-    def __init__(self, mcp: MCP3xxx, positive_pin: int, negative_pin: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        mcp: MCP3xxx,
+        positive_pin: int,
+        negative_pin: Optional[int] = None,
+        oversample: int = 1,
+        deadband: Optional[Deadband] = None,
+        calibration: Optional[Calibration] = None,
+        cache: Optional[ReadCache] = None,
+    ) -> None:
         if not isinstance(mcp, MCP3xxx):
             raise ValueError("mcp object is not a sibling of MCP3xxx class.")
         self._mcp = mcp
@@ -47,19 +72,96 @@ class AnalogIn:
                     "Differential pin mapping not defined. Please read the "
                     "documentation for valid differential channel mappings."
                 )
-        self._read_shift_left = 16 - self._mcp.BITS
-        self._read_shift_right = self._mcp.BITS - self._read_shift_left
+        if oversample < 1:
+            raise ValueError("oversample must be at least 1.")
+        self._command = self._mcp.command(self._pin_setting, self.is_differential)
+        self._oversample = oversample
+        self._samples = array("H", bytes(2 * oversample)) if oversample > 1 else None
+        # Same as filters.oversample_bits, inlined so the basic class loads no extra modules.
+        extra_bits = 0
+        while 4 ** (extra_bits + 1) <= oversample and self._mcp.BITS + extra_bits < 16:
+            extra_bits += 1
+        self._extra_bits = extra_bits
+        bits = self._mcp.BITS + extra_bits
+        self._bits = bits
+        self._read_shift_left = 16 - bits
+        self._read_shift_right = bits - self._read_shift_left
+        self.deadband = deadband
+        if calibration is not None and calibration.bits != bits:
+            raise ValueError("Calibration resolution does not match the readings.")
+        self._calibration = calibration
+        if cache is not None:
+            if cache.mcp is not mcp:
+                raise ValueError("cache does not belong to this mcp object.")
+            if oversample > 1:
+                raise ValueError("cache cannot be combined with oversample.")
+        self._cache = cache
+        # Built on first use, so only programs reading millivolts load fixedpoint.
+        self._millivolts = None
+        self._microvolts = None
+
+    def _read(self) -> int:
+        # Result is only 10 or 12 bits, plus any bits gained by oversampling.
+        if self._cache is not None:
+            return self._cache.read(self._pin_setting, self.is_differential)
+        if self._samples is None:
+            return self._mcp.read_command(self._command)
+        samples = self._mcp.read_into(
+            self._pin_setting, self._samples, is_differential=self.is_differential
+        )
+        return (sum(samples) << self._extra_bits) // self._oversample
 
     @property
     def value(self) -> int:
         """Returns the value of an ADC pin as an integer in the range [0, 65535]."""
-        # Initial result is only 10 or 12 bits.
-        result = int(self._mcp.read(self._pin_setting, is_differential=self.is_differential))
+        result = self._read()
         # Stretch to 16 bits and cover full range.
         return (result << self._read_shift_left) | (result >> self._read_shift_right)
 
+    def poll(self) -> Optional[int]:
+        """Take a reading and return it like `value` if it moved outside the `deadband`
+        since the last reported reading, otherwise return None. Without a deadband every
+        reading is returned."""
+        result = self._read()
+        if self.deadband is not None and not self.deadband.update(result):
+            return None
+        return (result << self._read_shift_left) | (result >> self._read_shift_right)
+
     @property
     def voltage(self) -> float:
         """Returns the voltage from the ADC pin as a floating point value.
-        Returned value ranges from 0 to ``reference_voltage``."""
+        Returned value ranges from 0 to ``reference_voltage``, or is looked up in the
+        `calibration` table if one is set."""
+        if self._calibration is not None:
+            return self._calibration.table[self._read()]
         return self.value * self._mcp.reference_voltage / 65535
+
+    @property
+    def millivolts(self) -> int:
+        """Returns the voltage from the ADC pin as an integer number of millivolts,
+        computed without floating point math unless a `calibration` is set."""
+        if self._calibration is not None:
+            return round(self.voltage * 1000)
+        if self._millivolts is None:
+            self._millivolts = self._fixed_scale(1000)
+        return self._millivolts.convert(self._read())
+
+    @property
+    def microvolts(self) -> int:
+        """Returns the voltage from the ADC pin as an integer number of microvolts,
+        computed without floating point math unless a `calibration` is set."""
+        if self._calibration is not None:
+            return round(self.voltage * 1_000_000)
+        if self._microvolts is None:
+            self._microvolts = self._fixed_scale(1_000_000)
+        return self._microvolts.convert(self._read())
+
+    def _fixed_scale(self, units: int) -> FixedScale:
+        from .fixedpoint import FixedScale  # noqa: PLC0415
+
+        return FixedScale(self._bits, self._mcp.reference_voltage, units)
+
+    @property
+    def calibration(self) -> Optional[Calibration]:
+        """The calibration applied by `voltage`, if any. (read-only)"""
+        return self._calibration
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.block`
+================================================
+Captured samples with the metadata needed to interpret them.
+
+A `SampleBlock` wraps an :mod:`array` of frames interleaved channel by channel without
+copying it. `SampleBlock.memoryview` shares that memory with ``socket.send``,
+``file.write`` or ``struct.unpack_from``, and NumPy reads it in place through
+``np.asarray(block)``. From Python 3.12 on the block itself supports the buffer
+protocol, so ``memoryview(block)`` works too.
+
+.. code-block:: python
+
+    block = scheduler.capture(256)
+    sock.send(block.memoryview())  # no copy
+    codes = block.as_numpy()  # (frames, channels) view, no copy
+
+* Author(s): Adafruit Industries
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from typing import Optional, Sequence
+except ImportError:
+    pass
+
+
+class SampleBlock:
+    """Frames of samples and their layout. The data is not copied.
+
+    :param array data: samples, ``len(channels)`` per frame, interleaved channel by
+        channel. Usually ``array('H')`` raw codes or ``array('f')`` volts.
+    :param channels: the pin of each value in a frame, in order.
+    :param float sample_rate: frames per second.
+    :param int bits: resolution of raw codes in ``data``.
+    :param float reference_voltage: reference voltage of the chip.
+    :param int timestamp_ns: ``time.monotonic_ns()`` of the first frame, if known.
+    """
+
+    def __init__(
+        self,
+        data: array,
+        channels: Sequence[int],
+        sample_rate: float,
+        bits: int,
+        reference_voltage: float,
+        timestamp_ns: Optional[int] = None,
+    ) -> None:
+        if len(data) % len(channels):
+            raise ValueError("data does not hold a whole number of frames.")
+        self.data = data
+        self.channels = tuple(channels)
+        self.sample_rate = sample_rate
+        self.bits = bits
+        self.reference_voltage = reference_voltage
+        self.timestamp_ns = timestamp_ns
+
+    @property
+    def frames(self) -> int:
+        """Number of frames in the block. (read-only)"""
+        return len(self.data) // len(self.channels)
+
+    @property
+    def duration(self) -> float:
+        """Time covered by the block in seconds. (read-only)"""
+        return self.frames / self.sample_rate
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: int):
+        return self.data[index]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def memoryview(self) -> memoryview:
+        """Returns a :class:`memoryview` of the samples, sharing their memory."""
+        return memoryview(self.data)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self.data)
+
+    def __array__(self, dtype=None, copy=None) -> "np.ndarray":  # noqa: PLW3201
+        # NumPy's way in before Python 3.12, which ignores __buffer__.
+        values = np.asarray(memoryview(self.data), dtype=dtype)
+        return values.copy() if copy else values
+
+    def as_numpy(self) -> "np.ndarray":
+        """Returns the samples as a ``(frames, channels)`` NumPy array sharing their
+        memory. Requires NumPy."""
+        if np is None:
+            raise RuntimeError("NumPy is required for as_numpy().")
+        return np.asarray(memoryview(self.data)).reshape(-1, len(self.channels))
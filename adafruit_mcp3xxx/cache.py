@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.cache`
+================================================
+Read-through cache of a chip's channels.
+
+When several parts of a program read the same slow-moving channels within moments of
+each other, a `ReadCache` answers from the last scan while it is younger than
+``max_age``. When it is older, one transaction scans every channel of the chip, so the
+next reads of the other channels are served too. Single-ended and differential readings
+are cached separately.
+
+.. code-block:: python
+
+    cache = ReadCache(mcp, max_age=0.05)
+    temperature = AnalogIn(mcp, 0, cache=cache)
+    light = AnalogIn(mcp, 1, cache=cache)
+    print(temperature.voltage, light.voltage)  # one scan serves both
+    print(cache.hits, cache.misses)
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+from array import array
+
+from .mcp3xxx import MCP3xxx, _check_mcp
+
+
+class ReadCache:
+    """Serves channel readings of ``mcp`` from a scan no older than ``max_age``.
+
+    :param MCP3xxx mcp: the chip to read.
+    :param float max_age: seconds a scan stays fresh.
+    """
+
+    def __init__(self, mcp: MCP3xxx, max_age: float = 0.01) -> None:
+        _check_mcp(mcp)
+        self._mcp = mcp
+        self.max_age = max_age
+        pins = range(mcp.CHANNELS)
+        # Index 0 holds differential readings and index 1 single-ended ones, like
+        # ``MCP3xxx._commands``.
+        self._commands = (mcp.pack_commands(pins, True), mcp.pack_commands(pins, False))
+        self._values = (
+            array("H", bytes(2 * mcp.CHANNELS)),
+            array("H", bytes(2 * mcp.CHANNELS)),
+        )
+        self._scanned = [None, None]
+        self.hits = 0
+        """Reads served from the cache."""
+        self.misses = 0
+        """Reads that needed a new scan."""
+
+    @property
+    def mcp(self) -> MCP3xxx:
+        """The chip being cached. (read-only)"""
+        return self._mcp
+
+    @property
+    def max_age(self) -> float:
+        """Seconds a scan stays fresh."""
+        return self._max_age_ns / 1_000_000_000
+
+    @max_age.setter
+    def max_age(self, max_age: float) -> None:
+        if max_age < 0:
+            raise ValueError("max_age must not be negative.")
+        self._max_age_ns = round(max_age * 1_000_000_000)
+
+    def read(self, pin: int, is_differential: bool = False) -> int:
+        """Returns the raw reading of ``pin``, scanning the chip if the cached reading is
+        stale. Takes the same arguments as `MCP3xxx.read`."""
+        kind = not is_differential
+        now = time.monotonic_ns()
+        scanned = self._scanned[kind]
+        values = self._values[kind]
+        if scanned is not None and now - scanned <= self._max_age_ns:
+            self.hits += 1
+            return values[pin]
+        self.misses += 1
+        self._mcp.read_packed(self._commands[kind], values)
+        self._scanned[kind] = now
+        return values[pin]
+
+    def invalidate(self) -> None:
+        """Make the next read scan the chip."""
+        self._scanned = [None, None]
+
+    def reset_counters(self) -> None:
+        """Set `hits` and `misses` back to zero."""
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.calibration`
+================================================
+Per-channel calibration compiled into a lookup table.
+
+A `Calibration` corrects the ideal voltage of every raw code with an offset and gain
+and, optionally, a piecewise-linear curve through measured points. All of that is
+evaluated once, when the calibration is created, into an ``array('f')`` with one entry
+per code. `AnalogIn.voltage` then costs a single table lookup, which matters on
+microcontrollers without a floating point unit.
+
+Only the parameters are persisted, so a calibration stored with `Calibration.to_bytes`
+takes a few dozen bytes and the table is rebuilt by `Calibration.from_bytes`.
+
+.. code-block:: python
+
+    cal = Calibration(mcp.BITS, mcp.reference_voltage, offset=-0.012, gain=1.004)
+    chan = AnalogIn(mcp, 0, calibration=cal)
+    print(chan.voltage)
+
+* Author(s): Adafruit Industries
+"""
+
+import struct
+from array import array
+
+try:
+    from typing import Optional, Sequence, Tuple
+except ImportError:
+    pass
+
+MAGIC = b"MCPC"
+VERSION = 1
+_HEADER = "<4sBBBddd"
+_POINT = "<dd"
+
+
+class Calibration:
+    """Offset, gain and optional piecewise-linear correction for one channel.
+
+    A code's ideal voltage is what `AnalogIn.voltage` reports for it without
+    calibration. The corrected voltage is ``ideal * gain + offset``, then mapped through
+    ``points`` if given.
+
+    :param int bits: resolution of the readings, i.e. the chip's ``BITS`` plus any bits
+        gained by oversampling.
+    :param float reference_voltage: reference voltage of the chip.
+    :param float offset: volts added after the gain.
+    :param float gain: factor applied to the ideal voltage.
+    :param points: optional ``(reading, actual)`` voltage pairs, sorted by reading. The
+        corrected voltage is interpolated between them and extrapolated from the first
+        and last two points outside them.
+    """
+
+    def __init__(
+        self,
+        bits: int,
+        reference_voltage: float,
+        offset: float = 0.0,
+        gain: float = 1.0,
+        points: Optional[Sequence[Tuple[float, float]]] = None,
+    ) -> None:
+        points = tuple(points) if points else ()
+        if len(points) == 1:
+            raise ValueError("Provide at least two calibration points.")
+        for i in range(1, len(points)):
+            if points[i][0] <= points[i - 1][0]:
+                raise ValueError("Calibration points must be sorted by reading.")
+        self.bits = bits
+        self.reference_voltage = reference_voltage
+        self.offset = offset
+        self.gain = gain
+        self.points = points
+        self.table = self._compile()
+        """``array('f')`` holding the corrected voltage of every code."""
+
+    def _compile(self) -> array:
+        size = 1 << self.bits
+        table = array("f", bytes(4 * size))
+        shift_left = 16 - self.bits
+        shift_right = self.bits - shift_left
+        scale = self.reference_voltage / 65535 * self.gain
+        offset = self.offset
+        points = self.points
+        segment = 0
+        for code in range(size):
+            volts = ((code << shift_left) | (code >> shift_right)) * scale + offset
+            if points:
+                # Codes rise monotonically, so the segment only ever moves forward.
+                while segment < len(points) - 2 and volts > points[segment + 1][0]:
+                    segment += 1
+                x0, y0 = points[segment]
+                x1, y1 = points[segment + 1]
+                volts = y0 + (volts - x0) * (y1 - y0) / (x1 - x0)
+            table[code] = volts
+        return table
+
+    def apply(self, codes: Sequence[int], out: Optional[array] = None) -> array:
+        """Returns the corrected voltages of a block of raw codes.
+
+        :param codes: raw codes at this calibration's resolution.
+        :param array out: optional ``array('f')`` to fill. Created if omitted.
+        """
+        if out is None:
+            out = array("f", bytes(4 * len(codes)))
+        table = self.table
+        for i, code in enumerate(codes):
+            out[i] = table[code]
+        return out
+
+    def to_bytes(self) -> bytes:
+        """Returns the calibration parameters as a compact binary blob."""
+        blob = struct.pack(
+            _HEADER,
+            MAGIC,
+            VERSION,
+            self.bits,
+            len(self.points),
+            self.reference_voltage,
+            self.offset,
+            self.gain,
+        )
+        for reading, actual in self.points:
+            blob += struct.pack(_POINT, reading, actual)
+        return blob
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "Calibration":
+        """Rebuild a calibration stored with `to_bytes`."""
+        magic, version, bits, count, reference_voltage, offset, gain = struct.unpack_from(
+            _HEADER, blob
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a version {VERSION} calibration.")
+        start = struct.calcsize(_HEADER)
+        size = struct.calcsize(_POINT)
+        points = [struct.unpack_from(_POINT, blob, start + i * size) for i in range(count)]
+        return cls(bits, reference_voltage, offset, gain, points)
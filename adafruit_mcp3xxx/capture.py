@@ -0,0 +1,276 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.capture`
+================================================
+Compact, append-only binary capture files.
+
+A capture file is a fixed header followed by one record per frame:
+
+========  =====  =============================================================
+Offset    Size   Contents
+========  =====  =============================================================
+0         4      magic ``b"MCPX"``
+4         1      format version (1)
+5         1      resolution in bits, e.g. 10 or 12, or more for oversampled codes
+6         1      packing: 0 = little-endian ``uint16`` per value, 1 = bit-packed
+7         1      1 if the values are differential readings
+8         8      frames per second, little-endian ``double``
+16        4      reference voltage, little-endian ``float``
+20        1      channels per frame
+21        n      pin of each value in a frame
+========  =====  =============================================================
+
+Bit-packed records hold the frame's values back to back, most significant bit first,
+padded to a whole byte at the end of each frame. Eight 12-bit MCP3208 channels take 12
+bytes per frame instead of 16, eight 10-bit MCP3008 channels 10 bytes. Because every
+record has the same size, a file truncated by a power loss is still readable up to its
+last whole frame.
+
+Records carry no timestamps: frame ``n`` is assumed to have been taken ``n / rate``
+seconds after the first, which is what `CaptureReader.slice_time` relies on. Frames
+the scheduler skipped (`~adafruit_mcp3xxx.scheduler.TimingStats.missed`) are not in the
+file and leave no trace, so every later frame appears earlier than it was taken. Check
+``missed`` after capturing, or start a new file when it grows, if timing matters.
+
+`CaptureWriter` works on CircuitPython and CPython. `CaptureReader` uses :mod:`mmap`
+and is meant for CPython.
+
+.. code-block:: python
+
+    with open("/sd/log.mcpx", "wb") as stream:
+        writer = CaptureWriter(stream, mcp, (0, 1, 2, 3), rate=100)
+        for timestamp, frame in SampleScheduler(mcp, (0, 1, 2, 3), 100).run():
+            writer.write(frame)
+
+    with CaptureReader("log.mcpx") as capture:
+        codes = capture.slice_time(3600.0, 3660.0, pins=(2,))
+
+* Author(s): Adafruit Industries
+"""
+
+import struct
+import sys
+from array import array
+
+from .mcp3xxx import MCP3xxx, _check_mcp
+
+try:
+    import mmap
+except ImportError:
+    mmap = None
+
+try:
+    from typing import Optional, Sequence
+except ImportError:
+    pass
+
+MAGIC = b"MCPX"
+VERSION = 1
+_HEADER = "<4sBBBBdfB"
+_HEADER_SIZE = struct.calcsize(_HEADER)
+
+
+def _record_size(channels: int, bits: int, packed: bool) -> int:
+    if packed:
+        return (channels * bits + 7) // 8
+    return 2 * channels
+
+
+class CaptureWriter:
+    """Appends frames of raw codes to a capture file, writing the header first.
+
+    :param stream: a binary stream opened for writing, e.g. ``open(path, "wb")``.
+    :param MCP3xxx mcp: the chip being captured, for its resolution and reference.
+    :param pins: the pin of each value in a frame, in order.
+    :param float rate: frames per second.
+    :param bool packed: bit-pack the values instead of storing one ``uint16`` each.
+    :param bool is_differential: whether the values are differential readings.
+    :param int bits: resolution of the codes. Defaults to the chip's ``BITS``; pass the
+        oversampled resolution when capturing oversampled codes.
+    """
+
+    def __init__(
+        self,
+        stream,
+        mcp: MCP3xxx,
+        pins: Sequence[int],
+        rate: float,
+        packed: bool = True,
+        is_differential: bool = False,
+        bits: Optional[int] = None,
+    ) -> None:
+        _check_mcp(mcp)
+        if bits is None:
+            bits = mcp.BITS
+        if not 0 < bits <= 16:
+            raise ValueError("bits must be between 1 and 16.")
+        self._stream = stream
+        self._channels = len(pins)
+        self._bits = bits
+        self._limit = (1 << bits) - 1
+        self._packed = packed
+        self._record = bytearray(_record_size(self._channels, self._bits, packed))
+        self._pad = len(self._record) * 8 - self._channels * self._bits
+        self.frames = 0
+        """Number of frames written."""
+        stream.write(
+            struct.pack(
+                _HEADER,
+                MAGIC,
+                VERSION,
+                self._bits,
+                int(packed),
+                int(is_differential),
+                rate,
+                mcp.reference_voltage,
+                self._channels,
+            )
+        )
+        stream.write(bytes(pins))
+
+    def write(self, frames: array) -> None:
+        """Append whole frames of raw codes, interleaved channel by channel.
+
+        :param array frames: ``array('H')`` holding a multiple of ``len(pins)`` values,
+            such as a `SampleScheduler` frame, a filled ``sample_into`` buffer or the
+            ``data`` of a `~adafruit_mcp3xxx.block.SampleBlock`. Every code must fit
+            in the capture's ``bits``.
+        """
+        channels = self._channels
+        count, partial = divmod(len(frames), channels)
+        if partial:
+            raise ValueError("frames must hold a whole number of frames.")
+        if count and max(frames) > self._limit:
+            raise ValueError(f"Codes must fit in {self._bits} bits.")
+        if not self._packed:
+            if sys.byteorder == "big":
+                frames = array("H", frames)
+                frames.byteswap()
+            self._stream.write(frames)
+            self.frames += count
+            return
+        bits = self._bits
+        pad = self._pad
+        record = self._record
+        size = len(record)
+        start = 0
+        for _ in range(count):
+            acc = 0
+            for i in range(start, start + channels):
+                acc = (acc << bits) | frames[i]
+            record[:] = (acc << pad).to_bytes(size, "big")
+            self._stream.write(record)
+            start += channels
+        self.frames += count
+
+    def flush(self) -> None:
+        """Flush the underlying stream."""
+        self._stream.flush()
+
+
+class CaptureReader:
+    """Random access to a capture file through a read-only memory map.
+
+    :param str path: the capture file.
+    """
+
+    def __init__(self, path: str) -> None:
+        if mmap is None:
+            raise RuntimeError("CaptureReader needs the mmap module.")
+        with open(path, "rb") as stream:
+            self._map = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            version,
+            self.bits,
+            packing,
+            differential,
+            self.rate,
+            self.reference_voltage,
+            channels,
+        ) = struct.unpack_from(_HEADER, self._map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a version {VERSION} capture file.")
+        self.packed = bool(packing)
+        self.is_differential = bool(differential)
+        self.pins = tuple(self._map[_HEADER_SIZE : _HEADER_SIZE + channels])
+        self._offset = _HEADER_SIZE + channels
+        self._record_size = _record_size(channels, self.bits, self.packed)
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._map.close()
+
+    def __enter__(self) -> "CaptureReader":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return (len(self._map) - self._offset) // self._record_size
+
+    @property
+    def duration(self) -> float:
+        """Time covered by the capture in seconds. (read-only)"""
+        return len(self) / self.rate
+
+    def read(
+        self, start: int = 0, stop: Optional[int] = None, pins: Optional[Sequence[int]] = None
+    ) -> array:
+        """Returns frames ``start`` to ``stop`` as an ``array('H')`` of raw codes,
+        interleaved channel by channel.
+
+        :param int start: first frame.
+        :param int stop: frame after the last one. Defaults to the end of the capture.
+        :param pins: the pins to return, in order. Defaults to all of them.
+        """
+        frames = len(self)
+        stop = frames if stop is None else min(stop, frames)
+        start = max(start, 0)
+        count = max(stop - start, 0)
+        channels = len(self.pins)
+        columns = range(channels) if pins is None else [self.pins.index(pin) for pin in pins]
+        offset = self._offset + start * self._record_size
+        if self.packed:
+            return self._unpack(offset, count, columns)
+        values = array("H")
+        values.frombytes(self._map[offset : offset + count * self._record_size])
+        if sys.byteorder == "big":
+            values.byteswap()
+        if pins is None:
+            return values
+        width = len(columns)
+        out = array("H", bytes(2 * count * width))
+        for j, column in enumerate(columns):
+            out[j::width] = values[column::channels]
+        return out
+
+    def _unpack(self, offset: int, count: int, columns: Sequence[int]) -> array:
+        out = array("H", bytes(2 * count * len(columns)))
+        bits = self.bits
+        mask = (1 << bits) - 1
+        size = self._record_size
+        # Distance of each wanted value's LSB from the end of the record.
+        last = size * 8 - len(self.pins) * bits
+        shifts = [(len(self.pins) - 1 - column) * bits + last for column in columns]
+        data = self._map
+        k = 0
+        for _ in range(count):
+            acc = int.from_bytes(data[offset : offset + size], "big")
+            for shift in shifts:
+                out[k] = (acc >> shift) & mask
+                k += 1
+            offset += size
+        return out
+
+    def slice_time(
+        self, start: float, stop: Optional[float] = None, pins: Optional[Sequence[int]] = None
+    ) -> array:
+        """Like `read`, with ``start`` and ``stop`` in seconds from the first frame."""
+        first = int(start * self.rate)
+        last = None if stop is None else int(stop * self.rate)
+        return self.read(first, last, pins)
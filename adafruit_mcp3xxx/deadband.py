@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.deadband`
+================================================
+Report readings only when they change.
+
+A `Deadband` remembers the last value it reported and accepts a new one only when it
+differs by more than a threshold. Optional hysteresis makes a change that reverses
+direction clear a wider band, so a signal sitting on the edge of the band does not
+flip back and forth. `ChangeMonitor` applies a deadband to every channel of a scan.
+
+.. code-block:: python
+
+    monitor = ChangeMonitor(mcp, range(8), threshold=4, hysteresis=2, callback=send)
+    while True:
+        monitor.poll()  # calls send(pin, code) only for channels that moved
+        time.sleep(0.1)
+
+* Author(s): Adafruit Industries
+"""
+
+from array import array
+
+from .mcp3xxx import MCP3xxx, _check_mcp
+
+try:
+    from typing import Callable, Optional, Sequence
+except ImportError:
+    pass
+
+
+def percent_to_codes(percent: float, bits: int) -> int:
+    """Returns ``percent`` of the full scale of a ``bits`` resolution reading, in LSBs.
+
+    :param float percent: fraction of full scale, in percent.
+    :param int bits: resolution of the reading, e.g. ``mcp.BITS``.
+    """
+    return int(percent * (1 << bits) / 100)
+
+
+class Deadband:
+    """Filters a stream of integer readings down to the significant changes.
+
+    :param int threshold: a reading is reported when it differs from the last reported
+        one by more than this many LSBs.
+    :param int hysteresis: additional LSBs a change must exceed when it is in the
+        opposite direction to the previous reported change.
+    """
+
+    def __init__(self, threshold: int, hysteresis: int = 0) -> None:
+        if threshold < 0 or hysteresis < 0:
+            raise ValueError("threshold and hysteresis must not be negative.")
+        self.threshold = threshold
+        self.hysteresis = hysteresis
+        self.reset()
+
+    @classmethod
+    def from_percent(cls, percent: float, bits: int, hysteresis: float = 0.0) -> "Deadband":
+        """Returns a deadband with ``percent`` and ``hysteresis`` given in percent of the
+        full scale of a ``bits`` resolution reading."""
+        return cls(percent_to_codes(percent, bits), percent_to_codes(hysteresis, bits))
+
+    def reset(self) -> None:
+        """Forget the last reported value, so the next reading is always reported."""
+        self.value = None
+        self._direction = 0
+
+    def update(self, reading: int) -> bool:
+        """Returns True, and makes ``reading`` the reported `value`, if it is a
+        significant change."""
+        last = self.value
+        if last is None:
+            self.value = reading
+            return True
+        delta = reading - last
+        direction = 1 if delta > 0 else -1
+        limit = self.threshold
+        if direction == -self._direction:
+            limit += self.hysteresis
+        if abs(delta) <= limit:
+            return False
+        self.value = reading
+        self._direction = direction
+        return True
+
+
+class ChangeMonitor:
+    """Scans ``pins`` and reports only the channels whose raw code changed by more than
+    ``threshold`` LSBs since they were last reported.
+
+    :param MCP3xxx mcp: the chip to read.
+    :param pins: the pins to watch, in order.
+    :param int threshold: deadband in LSBs of the chip's resolution.
+    :param int hysteresis: additional LSBs needed to report a change of direction.
+    :param callback: optional function called as ``callback(pin, code)`` for every
+        reported change.
+    :param bool is_differential: single-ended or differential reads for all ``pins``.
+    """
+
+    def __init__(
+        self,
+        mcp: MCP3xxx,
+        pins: Sequence[int],
+        threshold: int,
+        hysteresis: int = 0,
+        callback: Optional[Callable[[int, int], None]] = None,
+        is_differential: bool = False,
+    ) -> None:
+        _check_mcp(mcp)
+        self._mcp = mcp
+        self._pins = tuple(pins)
+        self._commands = mcp.pack_commands(pins, is_differential)
+        self._frame = array("H", bytes(2 * len(self._pins)))
+        self._bands = [Deadband(threshold, hysteresis) for _ in self._pins]
+        self._changed = array("B", bytes(len(self._pins)))
+        self.callback = callback
+
+    @property
+    def values(self) -> list:
+        """Last reported code of each pin, or None before the first `poll`. (read-only)"""
+        return [band.value for band in self._bands]
+
+    @property
+    def changed(self) -> array:
+        """``array('B')`` flagging, per pin, whether the last `poll` reported it. (read-only)"""
+        return self._changed
+
+    def poll(self) -> int:
+        """Scan every pin once, report the significant changes and return how many
+        there were. The first poll reports every pin."""
+        frame = self._mcp.read_packed(self._commands, self._frame)
+        changed = self._changed
+        callback = self.callback
+        count = 0
+        for i, band in enumerate(self._bands):
+            code = frame[i]
+            if band.update(code):
+                changed[i] = 1
+                count += 1
+                if callback is not None:
+                    callback(self._pins[i], code)
+            else:
+                changed[i] = 0
+        return count
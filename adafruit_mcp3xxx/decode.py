@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.decode`
+================================================
+Block decoding and scaling of raw frames captured with `MCP3xxx.transfer_packed`.
+
+When NumPy is installed (CPython/Blinka), every function works on the whole block with
+vectorized operations and returns :class:`numpy.ndarray` objects. Otherwise the same
+functions fall back to plain Python loops over :mod:`array` objects, which also works on
+CircuitPython.
+
+* Author(s): Adafruit Industries
+"""
+
+from array import array
+
+from .mcp3xxx import MCP3xxx
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from typing import Optional, Union
+
+    Block = Union[array, "np.ndarray"]
+except ImportError:
+    pass
+
+
+def decode_frames(mcp: MCP3xxx, in_buf: bytearray, count: Optional[int] = None) -> Block:
+    """Extract the raw 10 or 12 bit results from received frames.
+
+    :param MCP3xxx mcp: the chip the frames were read from, for its frame layout.
+    :param bytearray in_buf: frames returned by `MCP3xxx.transfer_packed`.
+    :param int count: number of frames to decode. Defaults to all whole frames in ``in_buf``.
+    :return: ``uint16`` codes, one per frame.
+    """
+    frame_len = mcp._frame_len
+    if count is None:
+        count = len(in_buf) // frame_len
+    msb = mcp._result_byte
+    mask = mcp._result_mask
+    if np is not None:
+        frames = np.frombuffer(in_buf, dtype=np.uint8, count=count * frame_len)
+        frames = frames.reshape(count, frame_len)
+        codes = (frames[:, msb] & mask).astype(np.uint16) << 8
+        codes |= frames[:, msb + 1]
+        return codes
+    codes = array("H", bytes(2 * count))
+    offset = msb
+    for i in range(count):
+        codes[i] = ((in_buf[offset] & mask) << 8) | in_buf[offset + 1]
+        offset += frame_len
+    return codes
+
+
+def stretch(codes: Block, bits: int) -> Block:
+    """Scale raw codes to the [0, 65535] range exactly like `AnalogIn.value`.
+
+    :param codes: raw results from `decode_frames`.
+    :param int bits: resolution of the chip, e.g. ``mcp.BITS``.
+    """
+    shift_left = 16 - bits
+    shift_right = bits - shift_left
+    if np is not None:
+        codes = np.asarray(codes, dtype=np.uint16)
+        return (codes << shift_left) | (codes >> shift_right)
+    values = array("H", bytes(2 * len(codes)))
+    for i, code in enumerate(codes):
+        values[i] = (code << shift_left) | (code >> shift_right)
+    return values
+
+
+def to_volts(codes: Block, bits: int, reference_voltage: float) -> Block:
+    """Convert raw codes to volts like `AnalogIn.voltage`, to ``float32`` precision.
+
+    :param codes: raw results from `decode_frames`.
+    :param int bits: resolution of the chip, e.g. ``mcp.BITS``.
+    :param float reference_voltage: e.g. ``mcp.reference_voltage``.
+    :return: ``float32`` voltages.
+    """
+    values = stretch(codes, bits)
+    scale = reference_voltage / 65535
+    if np is not None:
+        return values.astype(np.float32) * np.float32(scale)
+    volts = array("f", bytes(4 * len(values)))
+    for i, value in enumerate(values):
+        volts[i] = value * scale
+    return volts
@@ -0,0 +1,287 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.emulator`
+================================================
+Software MCP3xxx chips for running and benchmarking the drivers without hardware.
+
+`EmulatedSPI` stands in for :class:`busio.SPI` and `EmulatedMCP3xxx` for a chip on that
+bus; its `EmulatedMCP3xxx.chip_select` stands in for the :class:`digitalio.DigitalInOut`
+chip select pin. The chips decode the command bits exactly as the datasheets describe
+(start bit, SGL/DIFF and channel bits, sample and null bits) wherever they fall in the
+transfer, and answer with the conversion result clocked out MSB first.
+
+The bus also models time: every transfer advances `EmulatedSPI.elapsed_ns` by the
+clocks it would take at the configured baudrate, plus each chip's minimum chip select
+high time between conversions. Analog inputs can be constants or functions of that
+modelled time, and `EmulatedMCP3xxx.sample_rate` reports the rate achievable at the
+current baudrate.
+
+.. code-block:: python
+
+    from adafruit_mcp3xxx.emulator import EmulatedMCP3xxx, EmulatedSPI
+    from adafruit_mcp3xxx.mcp3008 import MCP3008
+
+    spi = EmulatedSPI()
+    chip = EmulatedMCP3xxx(spi, "MCP3008", inputs=[1.0, lambda t: 1.65 + t])
+    mcp = MCP3008(spi, chip.chip_select)
+
+.. note:: This module is meant for CPython.
+
+* Author(s): Adafruit Industries
+"""
+
+try:
+    from typing import Callable, Optional, Sequence, Union
+
+    Input = Union[float, Callable[[float], float]]
+except ImportError:
+    pass
+
+# channels, bits, command bits after the start bit, clocks between the last command bit
+# and the result MSB, minimum chip select high time in ns (datasheet values at 5 V).
+_PROTOCOLS = {
+    "MCP3002": (2, 10, 3, 1, 310),
+    "MCP3202": (2, 12, 3, 1, 500),
+    "MCP3004": (4, 10, 4, 2, 270),
+    "MCP3008": (8, 10, 4, 2, 270),
+    "MCP3204": (4, 12, 4, 2, 500),
+    "MCP3208": (8, 12, 4, 2, 500),
+}
+
+
+class EmulatedSPI:
+    """Stand-in for :class:`busio.SPI` that routes transfers to the selected
+    `EmulatedMCP3xxx` chips."""
+
+    def __init__(self) -> None:
+        self._chips = []
+        self._locked = False
+        self.baudrate = 100_000
+        self.transfers = 0
+        """Number of transfer calls made on the bus."""
+        self.elapsed_ns = 0
+        """Modelled bus time in nanoseconds."""
+
+    def _attach(self, chip: "EmulatedMCP3xxx") -> None:
+        self._chips.append(chip)
+
+    def try_lock(self) -> bool:
+        """Lock the bus. Returns False if it is already locked."""
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self) -> None:
+        """Release the bus lock."""
+        self._locked = False
+
+    def configure(
+        self, *, baudrate: int = 100_000, polarity: int = 0, phase: int = 0, bits: int = 8
+    ) -> None:
+        """Set the modelled clock. Only SPI mode 0 with 8-bit words is supported."""
+        if polarity or phase or bits != 8:
+            raise ValueError("MCP3xxx chips are emulated in SPI mode 0 with 8-bit words only.")
+        self.baudrate = baudrate
+
+    def write_readinto(
+        self,
+        out_buffer: bytes,
+        in_buffer: bytearray,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Clock ``out_buffer[out_start:out_end]`` out while reading into
+        ``in_buffer[in_start:in_end]``."""
+        if out_end is None:
+            out_end = len(out_buffer)
+        if in_end is None:
+            in_end = len(in_buffer)
+        if out_end - out_start != in_end - in_start:
+            raise ValueError("buffer slices must be of equal length")
+        data = bytes(out_buffer[out_start:out_end])
+        response = 0
+        for chip in self._chips:
+            if chip.selected:
+                response |= chip._clock(data)
+        in_buffer[in_start:in_end] = response.to_bytes(len(data), "big")
+        self._advance(len(data))
+
+    def write(self, buffer: bytes, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Clock ``buffer[start:end]`` out, discarding the input."""
+        if end is None:
+            end = len(buffer)
+        data = bytes(buffer[start:end])
+        for chip in self._chips:
+            if chip.selected:
+                chip._clock(data)
+        self._advance(len(data))
+
+    def readinto(
+        self,
+        buffer: bytearray,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+        write_value: int = 0,
+    ) -> None:
+        """Read into ``buffer[start:end]`` while clocking out ``write_value``."""
+        if end is None:
+            end = len(buffer)
+        out_buffer = bytes([write_value]) * (end - start)
+        self.write_readinto(out_buffer, buffer, in_start=start, in_end=end)
+
+    def _advance(self, nbytes: int) -> None:
+        self.transfers += 1
+        self.elapsed_ns += nbytes * 8 * 1_000_000_000 // self.baudrate
+
+
+class EmulatedPin:
+    """Stand-in for the :class:`digitalio.DigitalInOut` driving a chip's select line."""
+
+    def __init__(self, chip: "EmulatedMCP3xxx") -> None:
+        self._chip = chip
+        self._value = True
+
+    def switch_to_output(self, value: bool = False, **kwargs) -> None:
+        """Match the :class:`digitalio.DigitalInOut` API."""
+        self.value = value
+
+    @property
+    def value(self) -> bool:
+        """Level of the line. The chip is selected while it is low."""
+        return self._value
+
+    @value.setter
+    def value(self, value: bool) -> None:
+        if value != self._value:
+            self._value = value
+            self._chip._select(not value)
+
+
+class EmulatedMCP3xxx:
+    """Software model of one MCP3xxx chip attached to an `EmulatedSPI` bus.
+
+    :param EmulatedSPI spi: the bus the chip is on.
+    :param str chip: the part number, e.g. ``"MCP3008"``, or the driver class.
+    :param inputs: optional per-channel input voltages. Each is a number or a callable
+        taking the modelled time in seconds and returning volts.
+    :param float ref_voltage: reference voltage of the chip.
+    :param bool hardware_cs: treat every transfer as one complete chip select window,
+        like a bus driver that controls chip select itself. Use with ``cs=None``.
+    """
+
+    def __init__(
+        self,
+        spi: EmulatedSPI,
+        chip: str,
+        inputs: Optional[Sequence[Input]] = None,
+        ref_voltage: float = 3.3,
+        hardware_cs: bool = False,
+    ) -> None:
+        if not isinstance(chip, str):
+            chip = chip.__name__
+        if chip not in _PROTOCOLS:
+            raise ValueError("Unsupported chip " + chip)
+        self.name = chip
+        (
+            self.channels,
+            self.bits,
+            self._command_bits,
+            self._gap_bits,
+            self._cs_high_ns,
+        ) = _PROTOCOLS[chip]
+        self._spi = spi
+        self._hardware_cs = hardware_cs
+        self._inputs = [0.0] * self.channels
+        if inputs is not None:
+            for channel, value in enumerate(inputs):
+                self.set_input(channel, value)
+        self.ref_voltage = ref_voltage
+        self.conversions = 0
+        """Number of conversions the chip has performed."""
+        self.chip_select = EmulatedPin(self)
+        self._selected = hardware_cs
+        self._tx = 0
+        self._nbits = 0
+        self._code = None
+        spi._attach(self)
+
+    @property
+    def selected(self) -> bool:
+        """True while chip select is asserted. (read-only)"""
+        return self._selected
+
+    @property
+    def sample_rate(self) -> float:
+        """Conversions per second the chip achieved in modelled bus time. (read-only)"""
+        if not self._spi.elapsed_ns:
+            return 0.0
+        return self.conversions * 1_000_000_000 / self._spi.elapsed_ns
+
+    def set_input(self, channel: int, value: Input) -> None:
+        """Set the voltage, or a function of modelled time, applied to a channel."""
+        self._inputs[channel] = value
+
+    def voltage(self, channel: int) -> float:
+        """Returns the voltage on a channel at the current modelled time."""
+        value = self._inputs[channel]
+        if callable(value):
+            return value(self._spi.elapsed_ns / 1_000_000_000)
+        return value
+
+    def _select(self, selected: bool) -> None:
+        self._selected = selected
+        self._tx = 0
+        self._nbits = 0
+        self._code = None
+        if not selected:
+            self._spi.elapsed_ns += self._cs_high_ns
+
+    def _convert(self, command: int) -> int:
+        sgl = command >> (self._command_bits - 1)
+        if self._command_bits == 3:
+            # MCP3002/MCP3202: SGL/DIFF, ODD/SIGN, MSBF
+            channel = (command >> 1) & 0x01
+        else:
+            # MCP3004/MCP3008/MCP3204/MCP3208: SGL/DIFF, D2, D1, D0
+            channel = command & (self.channels - 1)
+        volts = self.voltage(channel)
+        if not sgl:
+            # Differential pairs are (0, 1), (2, 3)... with ``channel`` as IN+.
+            volts -= self.voltage(channel ^ 0x01)
+        self.conversions += 1
+        full_scale = 1 << self.bits
+        code = int(volts * full_scale / self.ref_voltage)
+        return min(max(code, 0), full_scale - 1)
+
+    def _clock(self, data: bytes) -> int:
+        """Clock ``data`` in and return what the chip drives on MISO meanwhile."""
+        if self._hardware_cs:
+            self._tx = 0
+            self._nbits = 0
+            self._code = None
+        nbits = len(data) * 8
+        self._tx = (self._tx << nbits) | int.from_bytes(data, "big")
+        self._nbits += nbits
+        tx = self._tx
+        total = self._nbits
+        if not tx:
+            return 0
+        # Bit positions count from the first clock after chip select went low.
+        start = total - tx.bit_length()
+        last_command_bit = start + self._command_bits
+        if last_command_bit >= total:
+            return 0
+        if self._code is None:
+            command = (tx >> (total - 1 - last_command_bit)) & ((1 << self._command_bits) - 1)
+            self._code = self._convert(command)
+        shift = total - (last_command_bit + 1 + self._gap_bits) - self.bits
+        response = self._code << shift if shift >= 0 else self._code >> -shift
+        return response & ((1 << nbits) - 1)
@@ -0,0 +1,240 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.filters`
+================================================
+Oversampling and decimation applied inside the acquisition loop.
+
+Every filter keeps a fixed amount of integer state per channel, so it can run for any
+length of time without growing memory, and only the filtered samples are kept. All
+filters work on raw codes and run on CircuitPython and CPython.
+
+Oversampling by ``4 ** n`` conversions and keeping the sum at ``n`` extra bits is the
+usual way to trade sample rate for resolution, e.g. a 12-bit MCP3208 oversampled 16
+times yields 14-bit results (given enough noise to dither the input).
+
+* Author(s): Adafruit Industries
+"""
+
+from array import array
+
+from .mcp3xxx import MCP3xxx
+
+try:
+    from typing import Optional, Sequence
+except ImportError:
+    pass
+
+
+def oversample_bits(oversample: int, bits: int) -> int:
+    """Returns the extra bits of resolution gained by averaging ``oversample``
+    conversions of a ``bits`` resolution chip, capped so the result fits in 16 bits.
+
+    :param int oversample: conversions averaged per reported sample.
+    :param int bits: resolution of the chip, e.g. ``mcp.BITS``.
+    """
+    extra = 0
+    while 4 ** (extra + 1) <= oversample and bits + extra < 16:
+        extra += 1
+    return extra
+
+
+class OversampledScan:
+    """Reads ``oversample`` back-to-back conversions of every pin in one bus transaction
+    and reports their boxcar mean per pin.
+
+    :param MCP3xxx mcp: the chip to read.
+    :param pins: the pins to read, in order.
+    :param int oversample: conversions averaged per reported sample.
+    :param int extra_bits: extra bits of resolution to keep. Defaults to
+        `oversample_bits` for the chip.
+    :param bool is_differential: single-ended or differential reads for all ``pins``.
+    """
+
+    def __init__(
+        self,
+        mcp: MCP3xxx,
+        pins: Sequence[int],
+        oversample: int,
+        extra_bits: Optional[int] = None,
+        is_differential: bool = False,
+    ) -> None:
+        if oversample < 1:
+            raise ValueError("oversample must be at least 1.")
+        if extra_bits is None:
+            extra_bits = oversample_bits(oversample, mcp.BITS)
+        self._mcp = mcp
+        self._count = len(pins)
+        self._oversample = oversample
+        self._extra_bits = extra_bits
+        repeated = []
+        for pin in pins:
+            repeated.extend([pin] * oversample)
+        self._commands = mcp.pack_commands(repeated, is_differential)
+        self._raw = array("H", bytes(2 * len(repeated)))
+
+    @property
+    def bits(self) -> int:
+        """Resolution of the reported samples. (read-only)"""
+        return self._mcp.BITS + self._extra_bits
+
+    def read(self, buf: Optional[array] = None) -> array:
+        """Take one oversampled reading of every pin.
+
+        :param array buf: optional ``array('H')`` with one entry per pin.
+        :return: ``buf`` holding `bits` resolution results.
+        """
+        if buf is None:
+            buf = array("H", bytes(2 * self._count))
+        raw = self._mcp.read_packed(self._commands, self._raw)
+        oversample = self._oversample
+        extra_bits = self._extra_bits
+        start = 0
+        for i in range(self._count):
+            total = 0
+            for j in range(start, start + oversample):
+                total += raw[j]
+            buf[i] = (total << extra_bits) // oversample
+            start += oversample
+        return buf
+
+
+class Decimator:
+    """Boxcar decimator: accumulates ``factor`` frames and outputs their mean.
+
+    :param int channels: values per frame.
+    :param int factor: input frames per output frame.
+    :param int extra_bits: extra bits of resolution to keep in the output.
+    """
+
+    def __init__(self, channels: int, factor: int, extra_bits: int = 0) -> None:
+        if factor < 1:
+            raise ValueError("factor must be at least 1.")
+        self._factor = factor
+        self._extra_bits = extra_bits
+        self._sums = [0] * channels
+        self._filled = 0
+        self.output = array("H", bytes(2 * channels))
+        """The most recent output frame."""
+
+    def push(self, frame: array) -> bool:
+        """Add one input frame.
+
+        :return: True when a new frame is available in `output`.
+        """
+        sums = self._sums
+        for i, value in enumerate(frame):
+            sums[i] += value
+        self._filled += 1
+        if self._filled < self._factor:
+            return False
+        factor = self._factor
+        extra_bits = self._extra_bits
+        output = self.output
+        for i, total in enumerate(sums):
+            output[i] = (total << extra_bits) // factor
+            sums[i] = 0
+        self._filled = 0
+        return True
+
+
+class MovingAverage:
+    """Moving average over the last ``length`` frames, one output per input frame.
+
+    :param int channels: values per frame.
+    :param int length: window length in frames.
+    """
+
+    def __init__(self, channels: int, length: int) -> None:
+        if length < 1:
+            raise ValueError("length must be at least 1.")
+        self._channels = channels
+        self._length = length
+        self._history = array("H", bytes(2 * channels * length))
+        self._sums = [0] * channels
+        self._index = 0
+        self._filled = 0
+        self.output = array("H", bytes(2 * channels))
+        """The most recent output frame."""
+
+    def push(self, frame: array) -> array:
+        """Add one input frame and return `output`. Until ``length`` frames have been
+        pushed, the average covers the frames seen so far."""
+        channels = self._channels
+        history = self._history
+        sums = self._sums
+        start = self._index * channels
+        if self._filled < self._length:
+            self._filled += 1
+        filled = self._filled
+        output = self.output
+        for i in range(channels):
+            value = frame[i]
+            sums[i] += value - history[start + i]
+            history[start + i] = value
+            output[i] = sums[i] // filled
+        self._index = (self._index + 1) % self._length
+        return output
+
+
+class CICDecimator:
+    """Cascaded integrator-comb decimator of order ``order``, with the gain of
+    ``factor ** order`` divided out of the output.
+
+    :param int channels: values per frame.
+    :param int factor: input frames per output frame.
+    :param int order: number of integrator and comb stages.
+    :param int extra_bits: extra bits of resolution to keep in the output.
+    """
+
+    def __init__(self, channels: int, factor: int, order: int = 2, extra_bits: int = 0) -> None:
+        if factor < 1 or order < 1:
+            raise ValueError("factor and order must be at least 1.")
+        self._channels = channels
+        self._factor = factor
+        self._order = order
+        self._extra_bits = extra_bits
+        self._gain = factor**order
+        # The integrators wrap around; as long as the register can hold the largest
+        # output, the comb differences still come out exact.
+        width = 17
+        while (1 << width) <= 65535 * self._gain:
+            width += 1
+        self._wrap = (1 << width) - 1
+        self._integrators = [[0] * order for _ in range(channels)]
+        self._combs = [[0] * order for _ in range(channels)]
+        self._filled = 0
+        self.output = array("H", bytes(2 * channels))
+        """The most recent output frame."""
+
+    def push(self, frame: array) -> bool:
+        """Add one input frame.
+
+        :return: True when a new frame is available in `output`.
+        """
+        order = self._order
+        wrap = self._wrap
+        for channel in range(self._channels):
+            stages = self._integrators[channel]
+            value = frame[channel]
+            for stage in range(order):
+                value = (value + stages[stage]) & wrap
+                stages[stage] = value
+        self._filled += 1
+        if self._filled < self._factor:
+            return False
+        self._filled = 0
+        gain = self._gain
+        extra_bits = self._extra_bits
+        output = self.output
+        for channel in range(self._channels):
+            value = self._integrators[channel][order - 1]
+            delays = self._combs[channel]
+            for stage in range(order):
+                previous = delays[stage]
+                delays[stage] = value
+                value = (value - previous) & wrap
+            output[channel] = (value << extra_bits) // gain
+        return True
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.fixedpoint`
+================================================
+Integer voltage conversion without floating point math.
+
+A `FixedScale` turns a raw code into millivolts, microvolts or any other integer unit
+with two multiplies, two adds and one shift: the whole units per code, then the
+fraction as a fixed-point multiplier. Both are chosen once so that every intermediate
+stays below ``2 ** 30``, which keeps them small ints on CircuitPython: no heap
+allocation and no FPU needed.
+
+.. code-block:: python
+
+    chan = AnalogIn(mcp, 0)
+    print(chan.millivolts, chan.microvolts)
+
+    scale = FixedScale(mcp.BITS, mcp.reference_voltage, MICROVOLTS)
+    microvolts = scale.convert_into(codes)
+
+* Author(s): Adafruit Industries
+"""
+
+from array import array
+
+try:
+    from typing import Optional, Sequence
+except ImportError:
+    pass
+
+MILLIVOLTS = 1000
+"""Units per volt for millivolt results."""
+MICROVOLTS = 1_000_000
+"""Units per volt for microvolt results."""
+
+# Largest intermediate allowed, so products stay CircuitPython small ints.
+_LIMIT = 1 << 30
+
+
+class FixedScale:
+    """Precomputed fixed-point conversion of ``bits`` resolution codes. The full scale
+    code converts to ``reference_voltage``, like `AnalogIn.voltage`, and results are
+    rounded to the nearest unit. The ``2 ** 30`` headroom limits the precision of the
+    fractional multiplier, so results can be off by up to `max_error` units: under 3
+    units for 16 bit codes, e.g. 3 microvolts against a 16 bit LSB of 76 microvolts at
+    5 V, and under one unit for 14 bit and smaller codes.
+
+    :param int bits: resolution of the codes, i.e. the chip's ``BITS`` plus any bits
+        gained by oversampling.
+    :param float reference_voltage: reference voltage of the chip.
+    :param int units: units per volt, e.g. `MILLIVOLTS` or `MICROVOLTS`.
+    """
+
+    def __init__(self, bits: int, reference_voltage: float, units: int = MILLIVOLTS) -> None:
+        full_scale = (1 << bits) - 1
+        reference = round(reference_voltage * units)
+        if reference >= _LIMIT:
+            raise ValueError("Reference voltage is too large for fixed-point conversion.")
+        whole, remainder = divmod(reference, full_scale)
+        shift = 0
+        multiplier = 0
+        # Grow the shift while the rounded fraction of the largest code still fits.
+        while True:
+            candidate = ((remainder << (shift + 2)) + full_scale) // (2 * full_scale)
+            if full_scale * candidate + (1 << shift) >= _LIMIT:
+                break
+            shift += 1
+            multiplier = candidate
+        self.bits = bits
+        self.whole = whole
+        """Whole units per code."""
+        self.multiplier = multiplier
+        """The fraction of a unit per code, scaled by ``2 ** shift``."""
+        self.shift = shift
+        self.rounding = (1 << shift) >> 1
+        self.max_error = 0.5 + full_scale / (1 << (shift + 1))
+        """Bound on the difference from the exact result, in units."""
+
+    def convert(self, code: int) -> int:
+        """Returns ``code`` in the integer unit."""
+        return code * self.whole + ((code * self.multiplier + self.rounding) >> self.shift)
+
+    def convert_into(self, codes: Sequence[int], out: Optional[array] = None) -> array:
+        """Converts a block of codes.
+
+        :param codes: raw codes at this scale's resolution.
+        :param array out: optional integer array to fill. An ``array('l')`` is created
+            if omitted.
+        """
+        if out is None:
+            out = array("l", [0] * len(codes))
+        whole = self.whole
+        multiplier = self.multiplier
+        rounding = self.rounding
+        shift = self.shift
+        for i, code in enumerate(codes):
+            out[i] = code * whole + ((code * multiplier + rounding) >> shift)
+        return out
@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:class:`~adafruit_mcp3xxx.layout.FrameLayout`
+================================================
+Declarative description of an MCP3xxx conversion frame.
+
+Every supported chip speaks the same protocol and differs only in where the bits sit
+in the frame: a start bit, the SGL/DIFF bit, a channel select field, then the result in
+the last ``BITS`` bits clocked in. A chip class describes that with a `FrameLayout` in
+its ``FRAME`` attribute, and `MCP3xxx` builds every command frame and the result mask
+from it once per class, so the read, bulk, burst and block decode paths work the same
+for every chip.
+
+* Author(s): Adafruit Industries
+"""
+
+try:
+    from typing import Tuple
+except ImportError:
+    pass
+
+
+class FrameLayout:
+    """Bit positions of one conversion frame. Bits are counted from 0, the first bit
+    clocked out after chip select goes low.
+
+    :param int length: bytes per frame.
+    :param int start: position of the start bit. The SGL/DIFF bit follows it, then the
+        channel select field, most significant bit first.
+    :param int channel_bits: width of the channel select field.
+    """
+
+    def __init__(self, length: int, start: int, channel_bits: int) -> None:
+        self.length = length
+        self.start = start
+        self.channel_bits = channel_bits
+        self._compiled = {}
+
+    def encode(self, pin: int, is_differential: bool) -> bytes:
+        """Returns the command frame selecting ``pin``.
+
+        :param int pin: individual or differential pin.
+        :param bool is_differential: single-ended or differential read.
+        """
+        bits = self.length * 8
+        sgl_shift = bits - 2 - self.start
+        command = (1 << (sgl_shift + 1)) | ((not is_differential) << sgl_shift)
+        command |= pin << (sgl_shift - self.channel_bits)
+        return command.to_bytes(self.length, "big")
+
+    def compile(self, bits: int, channels: int) -> Tuple[tuple, int, int]:
+        """Returns ``(commands, result_byte, result_mask)`` for a chip with ``bits`` of
+        resolution and ``channels`` inputs, computing it only on the first call.
+
+        ``commands[not is_differential][pin]`` is the command frame for ``pin``. The
+        result is ``((frame[result_byte] & result_mask) << 8) | frame[result_byte + 1]``.
+        """
+        key = (bits, channels)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            command_end = self.start + 2 + self.channel_bits
+            if command_end > self.length * 8 - bits or channels > 1 << self.channel_bits:
+                raise ValueError("Frame layout does not fit the chip's channels and BITS.")
+            commands = tuple(
+                tuple(self.encode(pin, not sgl) for pin in range(channels)) for sgl in (0, 1)
+            )
+            compiled = (commands, self.length - 2, (1 << (bits - 8)) - 1)
+            self._compiled[key] = compiled
+        return compiled
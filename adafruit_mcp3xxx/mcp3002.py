@@ -17,6 +17,7 @@ For proper wiring, please refer to `Package Type diagram
 datasheet.
 """
 
+from .layout import FrameLayout
 from .mcp3xxx import MCP3xxx
 
 # MCP3002 Pin Mapping
@@ -36,21 +37,8 @@ class MCP3002(MCP3xxx):
     """
 
     BITS = 10
+    CHANNELS = 2
+    MAX_BAUDRATE = ((2.7, 1_200_000), (5.0, 3_200_000))
     DIFF_PINS = {(0, 1): P0, (1, 0): P1}
-
-    def read(self, pin: int, is_differential: bool = False) -> int:
-        """SPI Interface for MCP3xxx-based ADCs reads. Due to 10-bit accuracy, the returned
-        value ranges [0, 1023].
-
-        :param int pin: individual or differential pin.
-        :param bool is_differential: single-ended or differential read.
-
-        .. note:: This library offers a helper class called `AnalogIn`_ for both single-ended
-            and differential reads. If you opt to not implement `AnalogIn`_ during differential
-            reads, then the ``pin`` parameter should be the first of the two pins associated with
-            the desired differential channel mapping.
-        """
-        self._out_buf[0] = 0x40 | ((not is_differential) << 5) | (pin << 4)
-        with self._spi_device as spi:
-            spi.write_readinto(self._out_buf, self._in_buf, out_end=2, in_end=2)
-        return ((self._in_buf[0] & 0x03) << 8) | self._in_buf[1]
+    # Two-byte frame: start bit, SGL/DIFF, ODD/SIGN, MSBF (0), then the result.
+    FRAME = FrameLayout(length=2, start=1, channel_bits=1)
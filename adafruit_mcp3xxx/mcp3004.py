@@ -39,22 +39,6 @@ class MCP3004(MCP3xxx):
     """
 
     BITS = 10
+    CHANNELS = 4
+    MAX_BAUDRATE = ((2.7, 1_350_000), (5.0, 3_600_000))
     DIFF_PINS = {(0, 1): P0, (1, 0): P1, (2, 3): P2, (3, 2): P3}
-
-    def read(self, pin: int, is_differential: bool = False) -> int:
-        """SPI Interface for MCP3xxx-based ADCs reads. Due to 10-bit accuracy, the returned
-        value ranges [0, 1023].
-
-        :param int pin: individual or differential pin.
-        :param bool is_differential: single-ended or differential read.
-
-        .. note:: This library offers a helper class called `AnalogIn`_ for both single-ended
-            and differential reads. If you opt to not implement `AnalogIn`_ during differential
-            reads, then the ``pin`` parameter should be the first of the two pins associated with
-            the desired differential channel mapping.
-        """
-        self._out_buf[1] = ((not is_differential) << 7) | (pin << 4)
-        with self._spi_device as spi:
-            # pylint: disable=no-member
-            spi.write_readinto(self._out_buf, self._in_buf)
-        return ((self._in_buf[1] & 0x03) << 8) | self._in_buf[2]
@@ -16,8 +16,14 @@ For proper wiring, please refer to `Package Type diagram
 and `Pin Description
 <https://ww1.microchip.com/downloads/aemDocuments/documents/APID/ProductDocuments/DataSheets/21034F.pdf#G1.1063009>`_
 section of the MCP3202 datasheet.
+
+.. note:: Earlier releases sent a 2-byte command frame, which only had room for result
+    bits B11..B2, so every reading came back as a quarter of the true 12-bit code. The
+    driver now sends the 3-byte frame of datasheet figure 6-1, so readings (and
+    `AnalogIn` values) are four times larger than with those releases for the same input.
 """
 
+from .layout import FrameLayout
 from .mcp3xxx import MCP3xxx
 
 # MCP3202 Pin Mapping
@@ -37,22 +43,9 @@ class MCP3202(MCP3xxx):
     """
 
     BITS = 12
+    CHANNELS = 2
+    MAX_BAUDRATE = ((2.7, 900_000), (5.0, 1_800_000))
     DIFF_PINS = {(0, 1): P0, (1, 0): P1}
-
-    def read(self, pin: int, is_differential: bool = False) -> int:
-        """SPI Interface for MCP3xxx-based ADCs reads. Due to 12-bit accuracy, the returned
-        value ranges [0, 4095].
-
-        :param int pin: individual or differential pin.
-        :param bool is_differential: single-ended or differential read.
-
-        .. note:: This library offers a helper class called `AnalogIn`_ for both single-ended
-            and differential reads. If you opt to not implement `AnalogIn`_ during differential
-            reads, then the ``pin`` parameter should be the first of the two pins associated with
-            the desired differential channel mapping.
-        """
-        self._out_buf[0] = 0x40 | ((not is_differential) << 5) | (pin << 4)
-        with self._spi_device as spi:
-            # pylint: disable=no-member
-            spi.write_readinto(self._out_buf, self._in_buf, out_end=2, in_end=2)
-        return ((self._in_buf[0] & 0x0F) << 8) | self._in_buf[1]
+    # Twelve result bits follow the null bit, so unlike the MCP3002 the frame needs a
+    # third byte: start bit, then SGL/DIFF, ODD/SIGN, MSBF (0) in the second byte.
+    FRAME = FrameLayout(length=3, start=7, channel_bits=1)
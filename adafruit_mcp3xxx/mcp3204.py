@@ -17,6 +17,7 @@ and `Pin Description section
 of the MCP3204/MCP3208 datasheet.
 """
 
+from .layout import FrameLayout
 from .mcp3xxx import MCP3xxx
 
 # MCP3204 Pin Mapping
@@ -40,23 +41,8 @@ class MCP3204(MCP3xxx):
     """
 
     BITS = 12
+    CHANNELS = 4
+    MAX_BAUDRATE = ((2.7, 1_000_000), (5.0, 2_000_000))
     DIFF_PINS = {(0, 1): P0, (1, 0): P1, (2, 3): P2, (3, 2): P3}
-
-    def read(self, pin: int, is_differential: bool = False) -> int:
-        """SPI Interface for MCP3xxx-based ADCs reads. Due to 10-bit accuracy, the returned
-        value ranges [0, 1023].
-
-        :param int pin: individual or differential pin.
-        :param bool is_differential: single-ended or differential read.
-
-        .. note:: This library offers a helper class called `AnalogIn`_ for both single-ended
-            and differential reads. If you opt to not implement `AnalogIn`_ during differential
-            reads, then the ``pin`` parameter should be the first of the two pins associated with
-            the desired differential channel mapping.
-        """
-        self._out_buf[0] = 0x04 | ((not is_differential) << 1) | (pin >> 2)
-        self._out_buf[1] = (pin & 0x03) << 6
-        with self._spi_device as spi:
-            # pylint: disable=no-member
-            spi.write_readinto(self._out_buf, self._in_buf)
-        return ((self._in_buf[1] & 0x0F) << 8) | self._in_buf[2]
+    # Start bit in the first byte so the 12 result bits end the third byte.
+    FRAME = FrameLayout(length=3, start=5, channel_bits=3)
@@ -40,13 +40,19 @@ Implementation Notes
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MCP3xxx.git"
 
+from array import array
+
 from adafruit_bus_device.spi_device import SPIDevice
 
+from .layout import FrameLayout
+
 try:
-    import typing
+    from typing import Optional, Sequence
 
     from busio import SPI
     from digitalio import DigitalInOut
+
+    from .stats import ReadStats
 except ImportError:
     pass
 
@@ -62,6 +68,14 @@ class MCP3xxx:
     :param int baudrate: the clock speed for communication to this SPI device. Defaults to 100k.
     """
 
+    BITS = 10
+    CHANNELS = 8
+    # Datasheet maximum clock frequency as (VDD, Hz) points, lowest supply first.
+    MAX_BAUDRATE = ((2.7, 1_350_000), (5.0, 3_600_000))
+    DIFF_PINS = {}
+    # Start bit in the last bit of the first byte, then SGL/DIFF and D2, D1, D0.
+    FRAME = FrameLayout(length=3, start=7, channel_bits=3)
+
     def __init__(
         self,
         spi_bus: SPI,
@@ -70,20 +84,104 @@ class MCP3xxx:
         baudrate: int = 100_000,
     ):
         self._spi_device = SPIDevice(spi_bus, cs, baudrate=baudrate)
-        self._out_buf = bytearray(3)
         self._in_buf = bytearray(3)
         self._ref_voltage = ref_voltage
-
-        self._out_buf[0] = 0x01  # some sub-classes will overwrite this
+        # Every command frame is encoded once per class from its FRAME layout. The outer
+        # tuple is indexed by the SGL bit (``not is_differential``), the inner one by pin.
+        self._commands, self._result_byte, self._result_mask = self.FRAME.compile(
+            self.BITS, self.CHANNELS
+        )
+        self._frame_len = self.FRAME.length
+        self._scan_commands = self.pack_commands(range(self.CHANNELS))
+        self._packed_in = bytearray(len(self._scan_commands))
+        self._stats = None
 
     @property
     def reference_voltage(self) -> float:
         """Returns the MCP3xxx's reference voltage. (read-only)"""
         return self._ref_voltage
 
+    @property
+    def baudrate(self) -> int:
+        """The SPI clock speed used for this chip. See `max_baudrate` for the fastest
+        clock the datasheet allows, and :py:func:`~adafruit_mcp3xxx.tuning.autotune_baudrate`
+        to find the fastest clock that reads reliably on a particular board."""
+        return self._spi_device.baudrate
+
+    @baudrate.setter
+    def baudrate(self, value: int) -> None:
+        device = self._spi_device
+        if self._stats is not None:
+            device = device.device
+        device.baudrate = value
+
+    @classmethod
+    def max_baudrate(cls, vdd: float = 3.3) -> int:
+        """Returns the datasheet maximum clock frequency for a supply voltage,
+        interpolated linearly between the points in `MAX_BAUDRATE`.
+
+        :param float vdd: supply voltage of the chip.
+        """
+        points = cls.MAX_BAUDRATE
+        low_vdd, low_rate = points[0]
+        if vdd < low_vdd:
+            raise ValueError("vdd is below the chip's minimum operating voltage.")
+        for high_vdd, high_rate in points[1:]:
+            if vdd <= high_vdd:
+                fraction = (vdd - low_vdd) / (high_vdd - low_vdd)
+                return int(low_rate + fraction * (high_rate - low_rate))
+            low_vdd, low_rate = high_vdd, high_rate
+        return low_rate
+
+    @property
+    def stats(self) -> Optional[ReadStats]:
+        """The counters collected since `enable_stats`, or ``None`` when disabled.
+        (read-only)"""
+        return self._stats
+
+    def enable_stats(self) -> ReadStats:
+        """Start recording transfer counts, bus lock wait, time spent in
+        ``write_readinto``, per-channel read rates and a latency histogram.
+        Stats are off by default and cost nothing until enabled.
+
+        :return: the `~adafruit_mcp3xxx.stats.ReadStats` being recorded into.
+        """
+        if self._stats is None:
+            # Imported here so the stats module only takes up RAM once it is used.
+            from .stats import ReadStats, _InstrumentedDevice  # noqa: PLC0415
+
+            commands = {}
+            for sgl, frames in enumerate(self._commands):
+                for pin, frame in enumerate(frames):
+                    commands[frame] = (pin, not sgl)
+            self._stats = ReadStats(commands)
+            self._spi_device = _InstrumentedDevice(self._spi_device, self._stats)
+        return self._stats
+
+    def disable_stats(self) -> None:
+        """Stop recording and restore the uninstrumented read paths."""
+        if self._stats is not None:
+            self._spi_device = self._spi_device.restore()
+            self._stats = None
+
+    def _decode(self, buf: bytearray) -> int:
+        """Extract the conversion result from a received frame."""
+        i = self._result_byte
+        return ((buf[i] & self._result_mask) << 8) | buf[i + 1]
+
+    def _cycle_cs(self) -> None:
+        """Deassert and reassert chip select to start a new conversion inside one
+        locked bus transaction. When the bus driver owns chip select (``cs`` is ``None``)
+        every ``write_readinto`` already delimits a conversion."""
+        cs = self._spi_device.chip_select
+        if cs is not None:
+            active = self._spi_device.cs_active_value
+            cs.value = not active
+            cs.value = active
+
     def read(self, pin: int, is_differential: bool = False) -> int:
-        """SPI Interface for MCP3xxx-based ADCs reads. Due to 10-bit accuracy, the returned
-        value ranges [0, 1023].
+        """SPI Interface for MCP3xxx-based ADCs reads. The returned value ranges [0, 1023]
+        on 10-bit chips and [0, 4095] on 12-bit chips.
 
         :param int pin: individual or differential pin.
         :param bool is_differential: single-ended or differential read.
@@ -93,7 +191,185 @@ class MCP3xxx:
             reads, then the ``pin`` parameter should be the first of the two pins associated with
             the desired differential channel mapping.
         """
-        self._out_buf[1] = ((not is_differential) << 7) | (pin << 4)
+        command = self.command(pin, is_differential)
+        in_buf = self._in_buf
+        with self._spi_device as spi:
+            spi.write_readinto(command, in_buf, in_end=self._frame_len)
+        i = self._result_byte
+        return ((in_buf[i] & self._result_mask) << 8) | in_buf[i + 1]
+
+    def command(self, pin: int, is_differential: bool = False) -> bytes:
+        """Returns the pre-encoded command frame for a pin, for use with `read_command`.
+
+        :param int pin: individual or differential pin.
+        :param bool is_differential: single-ended or differential read.
+        """
+        commands = self._commands[not is_differential]
+        if not 0 <= pin < len(commands):
+            raise ValueError("pin is out of range for this chip.")
+        return commands[pin]
+
+    def read_command(self, command: bytes) -> int:
+        """Fast path for `read` that sends a frame obtained from `command` as-is and
+        decodes the result, skipping all per-call encoding.
+
+        :param bytes command: a command frame returned by `command`.
+        """
+        in_buf = self._in_buf
         with self._spi_device as spi:
-            spi.write_readinto(self._out_buf, self._in_buf)
-        return ((self._in_buf[1] & 0x03) << 8) | self._in_buf[2]
+            spi.write_readinto(command, in_buf, in_end=self._frame_len)
+        i = self._result_byte
+        return ((in_buf[i] & self._result_mask) << 8) | in_buf[i + 1]
+
+    def _transfer_frames(self, spi: SPI, out_buf: bytes, in_buf: bytearray, count: int) -> None:
+        """Clock ``count`` packed frames through a bus that is already locked and
+        configured, cycling chip select between conversions. This is the single place
+        a bus backend able to queue several transfers per call would plug in."""
+        frame_len = self._frame_len
+        cycle_cs = self._cycle_cs
+        start = 0
+        for i in range(count):
+            if i:
+                cycle_cs()
+            end = start + frame_len
+            spi.write_readinto(
+                out_buf, in_buf, out_start=start, out_end=end, in_start=start, in_end=end
+            )
+            start = end
+
+    def read_many(
+        self,
+        pins: Sequence[int],
+        buf: Optional[array] = None,
+        is_differential: bool = False,
+    ) -> array:
+        """Read several channels while holding the SPI bus once. The bus is locked and
+        configured a single time for the whole scan; chip select is still cycled between
+        channels because every conversion needs its own frame.
+
+        :param pins: the pins to read, in order.
+        :param array buf: optional ``array('H')`` of at least ``len(pins)`` entries that
+            receives the results. A new array is allocated if omitted.
+        :param bool is_differential: single-ended or differential reads for all ``pins``.
+        :return: ``buf`` holding one raw result per pin.
+        """
+        if buf is None:
+            buf = array("H", bytes(2 * len(pins)))
+        commands = self._commands[not is_differential]
+        for pin in pins:
+            if not 0 <= pin < len(commands):
+                raise ValueError("pin is out of range for this chip.")
+        in_buf = self._in_buf
+        frame_len = self._frame_len
+        decode = self._decode
+        cycle_cs = self._cycle_cs
+        with self._spi_device as spi:
+            for i, pin in enumerate(pins):
+                if i:
+                    cycle_cs()
+                spi.write_readinto(commands[pin], in_buf, in_end=frame_len)
+                buf[i] = decode(in_buf)
+        return buf
+
+    def read_into(
+        self,
+        pin: int,
+        buf: array,
+        count: Optional[int] = None,
+        is_differential: bool = False,
+    ) -> array:
+        """Fill ``buf`` with back-to-back conversions of one channel while holding the SPI
+        bus. The command frame is built once and reused for the whole burst.
+
+        :param int pin: individual or differential pin.
+        :param buf: a writable ``array`` or ``memoryview`` of integers receiving the raw results.
+        :param int count: number of conversions to take. Defaults to ``len(buf)``.
+        :param bool is_differential: single-ended or differential read.
+        :return: ``buf``.
+        """
+        if count is None:
+            count = len(buf)
+        command = self.command(pin, is_differential)
+        in_buf = self._in_buf
+        frame_len = self._frame_len
+        decode = self._decode
+        cycle_cs = self._cycle_cs
+        with self._spi_device as spi:
+            for i in range(count):
+                if i:
+                    cycle_cs()
+                spi.write_readinto(command, in_buf, in_end=frame_len)
+                buf[i] = decode(in_buf)
+        return buf
+
+    def pack_commands(self, pins: Sequence[int], is_differential: bool = False) -> bytearray:
+        """Concatenate the command frames for ``pins`` into one transmit buffer for
+        `read_packed`. Build it once and reuse it for every scan of the same channels.
+
+        :param pins: the pins to read, in order. Pins may repeat.
+        :param bool is_differential: single-ended or differential reads for all ``pins``.
+        """
+        packed = bytearray()
+        for pin in pins:
+            packed.extend(self.command(pin, is_differential))
+        return packed
+
+    def _transfer_packed(self, commands: bytearray, in_buf: Optional[bytearray]) -> bytearray:
+        """`transfer_packed` without the view, for `read_packed`. The returned buffer
+        may be longer than ``commands``."""
+        if in_buf is None:
+            if len(self._packed_in) < len(commands):
+                self._packed_in = bytearray(len(commands))
+            in_buf = self._packed_in
+        with self._spi_device as spi:
+            self._transfer_frames(spi, commands, in_buf, len(commands) // self._frame_len)
+        return in_buf
+
+    def transfer_packed(
+        self, commands: bytearray, in_buf: Optional[bytearray] = None
+    ) -> memoryview:
+        """Run every frame of a buffer built by `pack_commands` in one bus transaction
+        and return the raw received frames without decoding them, e.g. for
+        :py:mod:`~adafruit_mcp3xxx.decode`.
+
+        :param bytearray commands: packed command frames from `pack_commands`.
+        :param bytearray in_buf: optional buffer of at least ``len(commands)`` bytes. An
+            internal buffer is reused if omitted.
+        :return: a view of the first ``len(commands)`` bytes of the receive buffer. The
+            internal buffer is overwritten by the next packed transfer.
+        """
+        return memoryview(self._transfer_packed(commands, in_buf))[: len(commands)]
+
+    def read_packed(self, commands: bytearray, buf: Optional[array] = None) -> array:
+        """Run every frame of a buffer built by `pack_commands` in one bus transaction
+        and decode the results in place from a single receive buffer.
+
+        :param bytearray commands: packed command frames from `pack_commands`.
+        :param array buf: optional ``array('H')`` with one entry per packed frame.
+        :return: ``buf`` holding one raw result per frame, in packing order.
+        """
+        frame_len = self._frame_len
+        count = len(commands) // frame_len
+        if buf is None:
+            buf = array("H", bytes(2 * count))
+        in_buf = self._transfer_packed(commands, None)
+        mask = self._result_mask
+        offset = self._result_byte
+        for i in range(count):
+            buf[i] = ((in_buf[offset] & mask) << 8) | in_buf[offset + 1]
+            offset += frame_len
+        return buf
+
+    def scan(self, buf: Optional[array] = None) -> array:
+        """Read every single-ended channel of the chip in one bus transaction.
+
+        :param array buf: optional ``array('H')`` of at least `CHANNELS` entries.
+        :return: ``buf`` indexed by channel number.
+        """
+        return self.read_packed(self._scan_commands, buf)
+
+
+def _check_mcp(mcp: MCP3xxx) -> None:
+    """Raise ValueError unless ``mcp`` is a chip driver, for the classes built on one."""
+    if not isinstance(mcp, MCP3xxx):
+        raise ValueError("mcp object is not a sibling of MCP3xxx class.")
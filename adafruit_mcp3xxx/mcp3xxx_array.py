@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:class:`~adafruit_mcp3xxx.mcp3xxx_array.MCP3xxxArray`
+============================================================
+Several MCP3xxx chips sharing one SPI bus, each with its own chip select line.
+
+Instead of every chip locking and configuring the bus for itself, `MCP3xxxArray`
+locks and configures the bus once per sweep and drives the chip select lines directly.
+The sweep is round-robin: channel 0 of every chip, then channel 1 of every chip, and
+so on, so the same channel on different chips is sampled as close together in time as
+possible. Results land in one block indexed by `channel_index`.
+
+Every sweep runs at the slowest `MCP3xxx.baudrate` of its chips at the time of the
+sweep, so changing a chip's clock or running
+:py:func:`~adafruit_mcp3xxx.tuning.autotune_baudrate` takes effect on the next `scan`.
+Chips with `MCP3xxx.enable_stats` on record their transfers from every sweep; each
+sweep also counts as one transaction of every such chip, with the lock wait, bus setup
+time and duration of the whole sweep.
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+from array import array
+
+from .mcp3xxx import MCP3xxx, _check_mcp
+
+try:
+    from typing import Optional, Sequence
+except ImportError:
+    pass
+
+
+class MCP3xxxArray:
+    """Scans every channel of several chips on one bus with a single lock acquisition.
+
+    :param chips: the chips to manage. They must share one SPI bus and each must have
+        its own chip select pin.
+    """
+
+    def __init__(self, chips: Sequence[MCP3xxx]) -> None:
+        if not chips:
+            raise ValueError("At least one chip is required.")
+        spi = chips[0]._spi_device.spi
+        for chip in chips:
+            _check_mcp(chip)
+            if chip._spi_device.spi is not spi:
+                raise ValueError("All chips must share the same SPI bus.")
+            if chip._spi_device.chip_select is None:
+                raise ValueError("Every chip needs its own chip select pin.")
+        self._chips = tuple(chips)
+        self._spi = spi
+        self._in_buf = bytearray(3)
+        offsets = []
+        total = 0
+        for chip in chips:
+            offsets.append(total)
+            total += chip.CHANNELS
+        self._offsets = tuple(offsets)
+        self._channels = total
+        # The whole sweep is flattened into one schedule of transfers up front.
+        schedule = []
+        for pin in range(max(chip.CHANNELS for chip in chips)):
+            for number, (chip, offset) in enumerate(zip(chips, offsets)):
+                if pin < chip.CHANNELS:
+                    device = chip._spi_device
+                    schedule.append(
+                        (
+                            number,
+                            device.chip_select,
+                            device.cs_active_value,
+                            chip.command(pin),
+                            chip._frame_len,
+                            chip._result_byte,
+                            chip._result_mask,
+                            offset + pin,
+                        )
+                    )
+        self._schedule = tuple(schedule)
+
+    @property
+    def chips(self) -> tuple:
+        """The managed chips, in the order given. (read-only)"""
+        return self._chips
+
+    @property
+    def channels(self) -> int:
+        """Total number of single-ended channels across all chips. (read-only)"""
+        return self._channels
+
+    def channel_index(self, chip: int, pin: int) -> int:
+        """Returns the index of ``pin`` on the ``chip``-th chip in a `scan` result.
+
+        :param int chip: position of the chip in `chips`.
+        :param int pin: channel on that chip.
+        """
+        if not 0 <= pin < self._chips[chip].CHANNELS:
+            raise ValueError("pin is out of range for this chip.")
+        return self._offsets[chip] + pin
+
+    def scan(self, buf: Optional[array] = None) -> array:
+        """Read every single-ended channel of every chip in one bus transaction.
+
+        :param array buf: optional ``array('H')`` of at least `channels` entries.
+        :return: ``buf`` indexed by `channel_index`.
+        """
+        if buf is None:
+            buf = array("H", bytes(2 * self._channels))
+        spi = self._spi
+        in_buf = self._in_buf
+        chips = self._chips
+        # The bus runs at the slowest clock any chip currently asks for.
+        baudrate = min(chip.baudrate for chip in chips)
+        stats = [chip.stats for chip in chips]
+        timed = any(stats)
+        start = time.monotonic_ns() if timed else 0
+        while not spi.try_lock():
+            time.sleep(0)
+        locked = time.monotonic_ns() if timed else 0
+        try:
+            spi.configure(baudrate=baudrate, polarity=0, phase=0)
+            configured = time.monotonic_ns() if timed else 0
+            for number, cs, active, command, frame_len, msb, mask, index in self._schedule:
+                chip_stats = stats[number]
+                if chip_stats is not None:
+                    transfer_start = time.monotonic_ns()
+                cs.value = active
+                try:
+                    spi.write_readinto(command, in_buf, in_end=frame_len)
+                finally:
+                    cs.value = not active
+                if chip_stats is not None:
+                    chip_stats._record_transfer(command, 0, time.monotonic_ns() - transfer_start)
+                buf[index] = ((in_buf[msb] & mask) << 8) | in_buf[msb + 1]
+        finally:
+            spi.unlock()
+        if timed:
+            elapsed = time.monotonic_ns() - start
+            for chip_stats in stats:
+                if chip_stats is not None:
+                    chip_stats._record_transaction(locked - start, configured - locked, elapsed)
+        return buf
@@ -0,0 +1,220 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.pipeline`
+================================================
+Composable, block-oriented sample processing.
+
+A pipeline starts with `source` and is extended with ``|``. Every stage receives and
+yields whole blocks, each an :mod:`array` holding a fixed number of frames interleaved
+channel by channel, so per-sample work happens in tight loops instead of through
+several layers of Python calls.
+
+.. code-block:: python
+
+    from adafruit_mcp3xxx.pipeline import decimate, source, to_volts, window
+
+    for block in source(mcp, (0, 1), 1000) | decimate(4) | to_volts() | window(256):
+        print(block)
+
+* Author(s): Adafruit Industries
+"""
+
+from array import array
+
+from . import decode
+from .block import SampleBlock
+from .mcp3xxx import MCP3xxx
+from .scheduler import SampleScheduler
+
+try:
+    from typing import Callable, Iterable, Iterator, Optional, Sequence
+except ImportError:
+    pass
+
+
+class Pipeline:
+    """A stream of blocks plus the layout every stage needs to interpret them.
+
+    :param blocks: iterable of blocks, ``channels`` values per frame.
+    :param int channels: values per frame.
+    :param float rate: frames per second.
+    :param int bits: resolution of raw codes in the blocks.
+    :param float reference_voltage: reference voltage of the chip.
+    :param pins: the pin of each value in a frame. Defaults to ``range(channels)``.
+    """
+
+    def __init__(
+        self,
+        blocks: Iterable[array],
+        channels: int,
+        rate: float,
+        bits: int,
+        reference_voltage: float,
+        pins: Optional[Sequence[int]] = None,
+    ) -> None:
+        self._blocks = blocks
+        self.channels = channels
+        self.rate = rate
+        self.bits = bits
+        self.reference_voltage = reference_voltage
+        self.pins = tuple(range(channels) if pins is None else pins)
+
+    def derive(self, blocks: Iterable[array], rate: Optional[float] = None) -> "Pipeline":
+        """Returns a pipeline over ``blocks`` with this pipeline's layout. For use by stages.
+
+        :param blocks: the new stream of blocks.
+        :param float rate: the new frame rate, if the stage changes it.
+        """
+        return Pipeline(
+            blocks,
+            self.channels,
+            self.rate if rate is None else rate,
+            self.bits,
+            self.reference_voltage,
+            self.pins,
+        )
+
+    def sample_blocks(self) -> Iterator[SampleBlock]:
+        """Yields each block wrapped, without copying, in a
+        `~adafruit_mcp3xxx.block.SampleBlock` carrying this pipeline's layout."""
+        for block in self._blocks:
+            yield SampleBlock(block, self.pins, self.rate, self.bits, self.reference_voltage)
+
+    def __or__(self, stage: Callable[["Pipeline"], "Pipeline"]) -> "Pipeline":
+        return stage(self)
+
+    def __iter__(self) -> Iterator[array]:
+        return iter(self._blocks)
+
+
+def _sample(scheduler: SampleScheduler, frames: int, count: Optional[int]) -> Iterator[array]:
+    for block in scheduler.blocks(frames, count):
+        yield block.data
+
+
+def source(
+    mcp: MCP3xxx,
+    channels: Sequence[int],
+    rate: float,
+    block: int = 64,
+    count: Optional[int] = None,
+    is_differential: bool = False,
+) -> Pipeline:
+    """Start a pipeline that scans ``channels`` at ``rate`` frames per second using a
+    `~adafruit_mcp3xxx.scheduler.SampleScheduler` and yields ``array('H')`` blocks of
+    ``block`` frames of raw codes. All blocks come from one continuous schedule, see
+    `SampleScheduler.blocks`.
+
+    :param MCP3xxx mcp: the chip to sample.
+    :param channels: the pins making up one frame, in order.
+    :param float rate: frames per second.
+    :param int block: frames per block.
+    :param int count: number of blocks to produce. Runs forever if omitted.
+    :param bool is_differential: single-ended or differential reads for all ``channels``.
+    """
+    scheduler = SampleScheduler(mcp, channels, rate, is_differential)
+    return Pipeline(
+        _sample(scheduler, block, count),
+        len(channels),
+        rate,
+        mcp.BITS,
+        mcp.reference_voltage,
+        channels,
+    )
+
+
+def _decimate(blocks: Iterable[array], channels: int, factor: int) -> Iterator[array]:
+    # Same boxcar as filters.Decimator, unrolled over whole blocks to avoid a slice per frame.
+    sums = [0] * channels
+    filled = 0
+    for block in blocks:
+        # Raw codes stay integers; volts and other float blocks are averaged as floats.
+        output = block[:0]
+        integer = output.typecode not in "fd"
+        for start in range(0, len(block), channels):
+            for channel in range(channels):
+                sums[channel] += block[start + channel]
+            filled += 1
+            if filled == factor:
+                for channel in range(channels):
+                    total = sums[channel]
+                    output.append(total // factor if integer else total / factor)
+                    sums[channel] = 0
+                filled = 0
+        if output:
+            yield output
+
+
+def decimate(factor: int) -> Callable[[Pipeline], Pipeline]:
+    """Stage that replaces every ``factor`` frames with their mean, in the blocks' own
+    type: integer blocks such as raw codes get the floor of the mean, float blocks such
+    as `to_volts` output the exact mean. Partial groups carry over to the next block, so
+    block sizes shrink by ``factor`` on average.
+
+    :param int factor: input frames per output frame.
+    """
+
+    def stage(pipeline: Pipeline) -> Pipeline:
+        blocks = _decimate(pipeline, pipeline.channels, factor)
+        return pipeline.derive(blocks, pipeline.rate / factor)
+
+    return stage
+
+
+def _to_volts(blocks: Iterable[array], bits: int, reference_voltage: float) -> Iterator[array]:
+    for block in blocks:
+        volts = decode.to_volts(block, bits, reference_voltage)
+        if not isinstance(volts, array):
+            # NumPy did the math; hand on an array('f') like every other stage.
+            volts = array("f", volts.tobytes())
+        yield volts
+
+
+def to_volts() -> Callable[[Pipeline], Pipeline]:
+    """Stage that converts raw codes to ``array('f')`` volts with
+    `~adafruit_mcp3xxx.decode.to_volts`, which matches `AnalogIn.voltage` to ``float32``
+    precision."""
+
+    def stage(pipeline: Pipeline) -> Pipeline:
+        return pipeline.derive(_to_volts(pipeline, pipeline.bits, pipeline.reference_voltage))
+
+    return stage
+
+
+def _window(blocks: Iterable[array], size: int) -> Iterator[array]:
+    pending = None
+    for block in blocks:
+        if pending is None:
+            pending = block[:0]
+        pending.extend(block)
+        while len(pending) >= size:
+            yield pending[:size]
+            pending = pending[size:]
+
+
+def window(frames: int) -> Callable[[Pipeline], Pipeline]:
+    """Stage that regroups the stream into blocks of exactly ``frames`` frames. A final
+    partial block is dropped.
+
+    :param int frames: frames per output block.
+    """
+
+    def stage(pipeline: Pipeline) -> Pipeline:
+        return pipeline.derive(_window(pipeline, frames * pipeline.channels))
+
+    return stage
+
+
+def map_blocks(func: Callable[[array], array]) -> Callable[[Pipeline], Pipeline]:
+    """Stage that applies ``func`` to every block, for custom processing.
+
+    :param func: takes a block and returns the block to pass on.
+    """
+
+    def stage(pipeline: Pipeline) -> Pipeline:
+        return pipeline.derive(func(block) for block in pipeline)
+
+    return stage
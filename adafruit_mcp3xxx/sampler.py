@@ -0,0 +1,209 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.sampler`
+================================================
+Background acquisition into a preallocated ring buffer.
+
+`ContinuousSampler` owns a thread that scans a fixed channel set at a fixed rate and
+writes every scan into a `RingBuffer`. Consumers drain the buffer whenever they like;
+they never block the acquisition thread and the acquisition thread never waits for them.
+
+.. note:: This module needs :mod:`threading` and is meant for CPython (e.g. Blinka on a
+    Raspberry Pi). It is not supported on CircuitPython.
+
+* Author(s): Adafruit Industries
+"""
+
+import threading
+import time
+from array import array
+
+from .mcp3xxx import MCP3xxx, _check_mcp
+
+try:
+    from typing import Optional, Sequence
+except ImportError:
+    pass
+
+
+class RingBuffer:
+    """Single-producer, single-consumer ring of fixed-size frames backed by one
+    ``array('H')``. When full, the oldest frames are overwritten. The producer only
+    advances the head and the consumer only advances the tail, so no lock is needed.
+
+    :param int capacity: number of frames held. Must be a power of two.
+    :param int channels: number of values in one frame.
+    """
+
+    def __init__(self, capacity: int, channels: int = 1) -> None:
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two.")
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._channels = channels
+        self._data = array("H", bytes(2 * capacity * channels))
+        self._started = 0  # frames whose write has begun
+        self._head = 0  # frames fully written
+        self._tail = 0  # frames ever consumed or dropped
+        self._overruns = 0
+
+    @property
+    def capacity(self) -> int:
+        """Number of frames the buffer holds. (read-only)"""
+        return self._capacity
+
+    @property
+    def channels(self) -> int:
+        """Number of values in one frame. (read-only)"""
+        return self._channels
+
+    @property
+    def available(self) -> int:
+        """Number of frames waiting to be read. (read-only)"""
+        return min(self._head - self._tail, self._capacity)
+
+    @property
+    def overruns(self) -> int:
+        """Number of frames overwritten before the consumer read them. (read-only)"""
+        return self._overruns
+
+    def write(self, frame: array) -> None:
+        """Append one frame. Producer side only.
+
+        :param array frame: ``channels`` values.
+        """
+        channels = self._channels
+        head = self._head
+        self._started = head + 1
+        start = (head & self._mask) * channels
+        self._data[start : start + channels] = frame
+        self._head = head + 1
+
+    def read_into(self, buf: array) -> int:
+        """Move as many whole frames as fit into ``buf``, oldest first. Consumer side only.
+
+        :param array buf: receives interleaved frames, ``channels`` values per frame.
+        :return: the number of frames copied.
+        """
+        channels = self._channels
+        capacity = self._capacity
+        head = self._head
+        tail = self._tail
+        if head - tail > capacity:
+            self._overruns += head - tail - capacity
+            tail = head - capacity
+        count = min(head - tail, len(buf) // channels)
+        data = self._data
+        for i in range(count):
+            start = ((tail + i) & self._mask) * channels
+            buf[i * channels : (i + 1) * channels] = data[start : start + channels]
+        # The producer may have lapped us while copying, or be midway through writing the
+        # next slot; drop every frame it could have overwritten.
+        lapped = self._started - capacity - tail
+        if lapped > 0:
+            lost = min(lapped, count)
+            self._overruns += lost
+            count -= lost
+            buf[: count * channels] = buf[lost * channels : (lost + count) * channels]
+            tail += lost
+        self._tail = tail + count
+        return count
+
+
+class ContinuousSampler:
+    """Scans ``pins`` at ``rate`` Hz on a background thread into a `RingBuffer`.
+
+    :param MCP3xxx mcp: the chip to sample. The sampler should be its only user.
+    :param pins: the channels making up one frame, in order.
+    :param float rate: frames per second.
+    :param int capacity: ring buffer size in frames. Must be a power of two.
+    :param bool is_differential: single-ended or differential reads for all ``pins``.
+    """
+
+    def __init__(
+        self,
+        mcp: MCP3xxx,
+        pins: Sequence[int],
+        rate: float,
+        capacity: int = 1024,
+        is_differential: bool = False,
+    ) -> None:
+        _check_mcp(mcp)
+        self._mcp = mcp
+        self._commands = mcp.pack_commands(pins, is_differential)
+        self._frame = array("H", bytes(2 * len(pins)))
+        self._period_ns = round(1_000_000_000 / rate)
+        self._buffer = RingBuffer(capacity, len(pins))
+        self._missed = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def buffer(self) -> RingBuffer:
+        """The ring buffer frames are written to. (read-only)"""
+        return self._buffer
+
+    @property
+    def overruns(self) -> int:
+        """Frames lost because the consumer fell behind. (read-only)"""
+        return self._buffer.overruns
+
+    @property
+    def missed_deadlines(self) -> int:
+        """Scans that started later than one full period after their deadline. (read-only)"""
+        return self._missed
+
+    @property
+    def running(self) -> bool:
+        """True while the acquisition thread is alive. (read-only)"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the acquisition thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="MCP3xxx sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the acquisition thread and wait for it to finish.
+
+        :param float timeout: seconds to wait for the thread to exit.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def read_into(self, buf: array) -> int:
+        """Drain frames into ``buf``. See `RingBuffer.read_into`."""
+        return self._buffer.read_into(buf)
+
+    def __enter__(self) -> "ContinuousSampler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        read_packed = self._mcp.read_packed
+        write = self._buffer.write
+        commands = self._commands
+        frame = self._frame
+        period = self._period_ns
+        wait = self._stop.wait
+        deadline = time.monotonic_ns()
+        while not self._stop.is_set():
+            write(read_packed(commands, frame))
+            deadline += period
+            delay = deadline - time.monotonic_ns()
+            if delay > 0:
+                wait(delay / 1_000_000_000)
+            elif delay < -period:
+                self._missed += 1
+                deadline = time.monotonic_ns()
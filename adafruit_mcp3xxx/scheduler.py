@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.scheduler`
+================================================
+Drift-free, timestamped sampling on an absolute deadline schedule.
+
+Deadlines are computed as ``start + n * period`` from ``time.monotonic_ns()``, so the
+time spent reading and processing never accumulates as drift. Every scan is stamped
+with the time it actually started and the lateness against its deadline is collected
+in `TimingStats`.
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+from array import array
+
+from .block import SampleBlock
+from .mcp3xxx import MCP3xxx, _check_mcp
+
+try:
+    from typing import Iterator, Optional, Sequence, Tuple
+except ImportError:
+    pass
+
+
+class TimingStats:
+    """Achieved rate and jitter of a `SampleScheduler`. All times are in nanoseconds."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        self.samples = 0
+        self.missed = 0
+        self.first_ns = 0
+        self.last_ns = 0
+        self.max_jitter_ns = 0
+        self._jitter_sum = 0
+        self._jitter_sq_sum = 0
+
+    def add(self, timestamp_ns: int, jitter_ns: int) -> None:
+        """Record one sample taken at ``timestamp_ns``, ``jitter_ns`` after its deadline."""
+        if not self.samples:
+            self.first_ns = timestamp_ns
+        self.samples += 1
+        self.last_ns = timestamp_ns
+        self._jitter_sum += jitter_ns
+        self._jitter_sq_sum += jitter_ns * jitter_ns
+        self.max_jitter_ns = max(self.max_jitter_ns, jitter_ns)
+
+    @property
+    def achieved_rate(self) -> float:
+        """Samples per second between the first and last sample. (read-only)"""
+        if self.samples < 2 or self.last_ns == self.first_ns:
+            return 0.0
+        return (self.samples - 1) * 1_000_000_000 / (self.last_ns - self.first_ns)
+
+    @property
+    def mean_jitter_ns(self) -> float:
+        """Mean lateness of a sample against its deadline. (read-only)"""
+        return self._jitter_sum / self.samples if self.samples else 0.0
+
+    @property
+    def rms_jitter_ns(self) -> float:
+        """Root-mean-square lateness of a sample against its deadline. (read-only)"""
+        return (self._jitter_sq_sum / self.samples) ** 0.5 if self.samples else 0.0
+
+
+class SampleScheduler:
+    """Scans ``pins`` at ``rate`` Hz on an absolute deadline schedule.
+
+    When a scan starts more than a period late, the deadlines it overran are counted in
+    `TimingStats.missed` and skipped; the schedule keeps its original phase. `blocks`
+    tolerates more lateness, since a consumer of blocks does its work between them.
+
+    :param MCP3xxx mcp: the chip to sample.
+    :param pins: the channels making up one frame, in order.
+    :param float rate: frames per second.
+    :param bool is_differential: single-ended or differential reads for all ``pins``.
+    """
+
+    def __init__(
+        self,
+        mcp: MCP3xxx,
+        pins: Sequence[int],
+        rate: float,
+        is_differential: bool = False,
+    ) -> None:
+        _check_mcp(mcp)
+        self._mcp = mcp
+        self._pins = tuple(pins)
+        self._channels = len(pins)
+        self._commands = mcp.pack_commands(pins, is_differential)
+        self._frame = array("H", bytes(2 * self._channels))
+        self._rate = rate
+        self._period_ns = round(1_000_000_000 / rate)
+        self.stats = TimingStats()
+
+    @property
+    def period_ns(self) -> int:
+        """Nominal time between scans. (read-only)"""
+        return self._period_ns
+
+    def run(self, count: Optional[int] = None, catch_up: int = 1) -> Iterator[Tuple[int, array]]:
+        """Yields ``(timestamp_ns, frame)`` for each scan. ``frame`` is reused between
+        scans; copy it if it must outlive the next iteration.
+
+        :param int count: number of scans. Runs forever if omitted.
+        :param int catch_up: periods a scan may fall behind its deadline before the
+            overrun deadlines are skipped. Scans less late than that are taken back to
+            back until the schedule has caught up.
+        """
+        read_packed = self._mcp.read_packed
+        commands = self._commands
+        frame = self._frame
+        period = self._period_ns
+        limit = catch_up * period
+        stats = self.stats
+        deadline = time.monotonic_ns()
+        taken = 0
+        while count is None or taken < count:
+            now = time.monotonic_ns()
+            delay = deadline - now
+            if delay > 0:
+                time.sleep(delay / 1_000_000_000)
+                now = time.monotonic_ns()
+            late = now - deadline
+            if late >= limit:
+                skipped = late // period
+                stats.missed += skipped
+                deadline += skipped * period
+                late -= skipped * period
+            read_packed(commands, frame)
+            stats.add(now, late)
+            taken += 1
+            yield now, frame
+            deadline += period
+
+    def sample_into(self, buf: array, timestamps: Optional[array] = None) -> int:
+        """Fill ``buf`` with whole frames, interleaved channel by channel. Every call
+        starts a new schedule; use `blocks` for a continuous stream of blocks.
+
+        :param array buf: receives ``len(buf) // len(pins)`` frames.
+        :param array timestamps: optional ``array('q')`` receiving one timestamp per frame.
+        :return: the number of frames taken.
+        """
+        channels = self._channels
+        count = len(buf) // channels
+        start = 0
+        for i, (now, frame) in enumerate(self.run(count)):
+            buf[start : start + channels] = frame
+            start += channels
+            if timestamps is not None:
+                timestamps[i] = now
+        return count
+
+    def capture(self, frames: int) -> SampleBlock:
+        """Take ``frames`` scans into a new `~adafruit_mcp3xxx.block.SampleBlock` of raw
+        codes, stamped with the time of its first frame. Every call starts a new
+        schedule; use `blocks` for a continuous stream of blocks.
+
+        :param int frames: number of scans to take.
+        """
+        data = array("H", bytes(2 * frames * self._channels))
+        timestamps = array("q", bytes(8 * frames))
+        self.sample_into(data, timestamps)
+        return SampleBlock(
+            data,
+            self._pins,
+            self._rate,
+            self._mcp.BITS,
+            self._mcp.reference_voltage,
+            timestamps[0] if frames else None,
+        )
+
+    def blocks(self, frames: int, count: Optional[int] = None) -> Iterator[SampleBlock]:
+        """Yields `~adafruit_mcp3xxx.block.SampleBlock` objects of ``frames`` scans each,
+        all from one continuous schedule, so the time the consumer spends between
+        blocks does not shift it. Scans delayed by the consumer are caught up as long as
+        they are less than a block late; beyond that the overrun deadlines are skipped
+        and counted in `TimingStats.missed`.
+
+        :param int frames: scans per block.
+        :param int count: number of blocks. Runs forever if omitted.
+        """
+        if frames < 1:
+            raise ValueError("frames must be at least 1.")
+        channels = self._channels
+        size = frames * channels
+        bits = self._mcp.BITS
+        reference_voltage = self._mcp.reference_voltage
+        data = None
+        first = 0
+        start = 0
+        for now, frame in self.run(None if count is None else count * frames, frames):
+            if not start:
+                data = array("H", bytes(2 * size))
+                first = now
+            data[start : start + channels] = frame
+            start += channels
+            if start == size:
+                start = 0
+                yield SampleBlock(data, self._pins, self._rate, bits, reference_voltage, first)
@@ -0,0 +1,434 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.server`
+================================================
+One process owns the chip and shares its scans with any number of other processes.
+
+`AcquisitionServer` samples a fixed set of pins with a
+`~adafruit_mcp3xxx.scheduler.SampleScheduler` and writes every frame, with its
+timestamp, into a ring buffer in :mod:`multiprocessing.shared_memory`. Each
+`SampleClient` attaches to the ring by name and reads at its own pace; clients never
+touch the bus and never block the server or each other.
+
+Start a server from the command line (CPython with Blinka):
+
+.. code-block:: shell
+
+    python -m adafruit_mcp3xxx.server --chip MCP3008 --cs D5 --pins 0 1 2 3 --rate 1000
+
+and read from any number of other processes:
+
+.. code-block:: python
+
+    from adafruit_mcp3xxx.server import SampleClient
+
+    with SampleClient("mcp3xxx") as client:
+        for block in client.blocks(256):
+            process(block.as_numpy())
+
+One process can own several chips on the bus by running one `AcquisitionServer` per
+chip, each on its own thread and ring. Give the chips a `SharedBus` in place of the
+bus, because the ``try_lock`` of Blinka's ``busio.SPI`` is not atomic across threads:
+two of them could both take it and select two chips at once. Given several ``--cs``
+pins, the command line server does that and names the rings ``mcp3xxx-0``,
+``mcp3xxx-1`` and so on.
+
+The shared memory holds a 32 byte header, the ``started`` and ``head`` frame counters,
+the pin map, one ``int64`` timestamp per slot and the ``uint16`` frames. As in
+`~adafruit_mcp3xxx.sampler.RingBuffer`, the server bumps ``started`` before writing a
+slot and ``head`` after, so readers can tell when a slot was overwritten under them.
+
+.. note:: This module needs :mod:`multiprocessing.shared_memory` and is meant for
+    CPython. It is not supported on CircuitPython.
+
+* Author(s): Adafruit Industries
+"""
+
+import argparse
+import struct
+import threading
+import time
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+
+from . import mcp3002, mcp3004, mcp3008, mcp3202, mcp3204, mcp3208
+from .block import SampleBlock
+from .mcp3xxx import MCP3xxx
+from .scheduler import SampleScheduler
+
+try:
+    from typing import Iterator, Optional, Sequence
+except ImportError:
+    pass
+
+MAGIC = b"MCPS"
+VERSION = 1
+_HEADER = "<4sBBHIxxxxdd"
+_COUNTERS = struct.calcsize(_HEADER)
+_PINS = _COUNTERS + 16
+# Names of the blocks created by servers in this process, which clients must leave
+# registered with the resource tracker.
+_created = set()
+
+
+def _layout(channels: int, capacity: int) -> tuple:
+    timestamps = _PINS + ((channels + 7) & ~7)
+    data = timestamps + 8 * capacity
+    return timestamps, data, data + 2 * capacity * channels
+
+
+class _SharedRing:
+    """Typed views onto the shared memory block."""
+
+    def __init__(self, memory: shared_memory.SharedMemory) -> None:
+        self.memory = memory
+        (magic, version, self.bits, self.channels, self.capacity, self.rate, self.ref) = (
+            struct.unpack_from(_HEADER, memory.buf)
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{memory.name} is not a version {VERSION} sample ring.")
+        timestamps, data, end = _layout(self.channels, self.capacity)
+        self.pins = tuple(memory.buf[_PINS : _PINS + self.channels])
+        self.counters = memory.buf[_COUNTERS:_PINS].cast("q")
+        self.timestamps = memory.buf[timestamps:data].cast("q")
+        self.data = memory.buf[data:end].cast("H")
+
+    def release(self) -> None:
+        self.counters.release()
+        self.timestamps.release()
+        self.data.release()
+        self.memory.close()
+
+
+class SharedBus:
+    """An SPI bus whose ``try_lock`` also takes a :class:`threading.Lock`, so that only
+    one thread at a time can hold it. Everything else is passed through to ``spi``.
+
+    :param spi: the ``busio.SPI`` bus to share between threads.
+    """
+
+    def __init__(self, spi) -> None:
+        self._spi = spi
+        self._lock = threading.Lock()
+
+    def try_lock(self) -> bool:
+        if not self._lock.acquire(False):
+            return False
+        if self._spi.try_lock():
+            return True
+        self._lock.release()
+        return False
+
+    def unlock(self) -> None:
+        self._spi.unlock()
+        self._lock.release()
+
+    def __getattr__(self, name: str):
+        return getattr(self._spi, name)
+
+
+class AcquisitionServer:
+    """Samples ``pins`` at ``rate`` Hz into a named shared memory ring.
+
+    :param MCP3xxx mcp: the chip to sample. The server should be its only user.
+    :param pins: the channels making up one frame, in order.
+    :param float rate: frames per second.
+    :param str name: name of the shared memory block clients attach to.
+    :param int capacity: ring size in frames. Must be a power of two.
+    :param bool is_differential: single-ended or differential reads for all ``pins``.
+    """
+
+    def __init__(
+        self,
+        mcp: MCP3xxx,
+        pins: Sequence[int],
+        rate: float,
+        name: str = "mcp3xxx",
+        capacity: int = 4096,
+        is_differential: bool = False,
+    ) -> None:
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two.")
+        self._scheduler = SampleScheduler(mcp, pins, rate, is_differential)
+        channels = len(pins)
+        size = _layout(channels, capacity)[2]
+        memory = shared_memory.SharedMemory(name, create=True, size=size)
+        struct.pack_into(
+            _HEADER,
+            memory.buf,
+            0,
+            MAGIC,
+            VERSION,
+            mcp.BITS,
+            channels,
+            capacity,
+            rate,
+            mcp.reference_voltage,
+        )
+        memory.buf[_PINS : _PINS + channels] = bytes(pins)
+        _created.add(memory.name)
+        self._ring = _SharedRing(memory)
+        self._running = False
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block. (read-only)"""
+        return self._ring.memory.name
+
+    @property
+    def scheduler(self) -> SampleScheduler:
+        """The scheduler driving acquisition, for its timing statistics. (read-only)"""
+        return self._scheduler
+
+    def serve(self, count: Optional[int] = None) -> None:
+        """Sample into the ring until `stop` is called or ``count`` frames were taken.
+
+        :param int count: number of frames to take. Runs until stopped if omitted.
+        """
+        ring = self._ring
+        counters = ring.counters
+        timestamps = ring.timestamps
+        data = ring.data
+        channels = ring.channels
+        mask = ring.capacity - 1
+        head = counters[1]
+        self._running = True
+        for now, frame in self._scheduler.run(count):
+            slot = head & mask
+            counters[0] = head + 1
+            data[slot * channels : (slot + 1) * channels] = frame
+            timestamps[slot] = now
+            head += 1
+            counters[1] = head
+            if not self._running:
+                break
+        self._running = False
+
+    def stop(self) -> None:
+        """Make `serve` return after the current frame."""
+        self._running = False
+
+    def close(self) -> None:
+        """Release and remove the shared memory block."""
+        self._ring.release()
+        self._ring.memory.unlink()
+        _created.discard(self._ring.memory.name)
+
+    def __enter__(self) -> "AcquisitionServer":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class SampleClient:
+    """Reads frames published by an `AcquisitionServer`, starting with the next frame
+    written after it attaches.
+
+    :param str name: name of the server's shared memory block.
+    """
+
+    def __init__(self, name: str = "mcp3xxx") -> None:
+        try:
+            memory = shared_memory.SharedMemory(name, track=False)
+        except TypeError:
+            # Before Python 3.13 attaching registers the block with this process's
+            # resource tracker, which would unlink it when the client exits. A server in
+            # the same process registered it already and unregisters it in close().
+            memory = shared_memory.SharedMemory(name)
+            if memory.name not in _created:
+                resource_tracker.unregister(memory._name, "shared_memory")
+        self._ring = _SharedRing(memory)
+        self._tail = self._ring.counters[1]
+        self._overruns = 0
+
+    @property
+    def pins(self) -> tuple:
+        """The pin of each value in a frame. (read-only)"""
+        return self._ring.pins
+
+    @property
+    def rate(self) -> float:
+        """Frames per second the server samples at. (read-only)"""
+        return self._ring.rate
+
+    @property
+    def bits(self) -> int:
+        """Resolution of the chip. (read-only)"""
+        return self._ring.bits
+
+    @property
+    def reference_voltage(self) -> float:
+        """Reference voltage of the chip. (read-only)"""
+        return self._ring.ref
+
+    @property
+    def available(self) -> int:
+        """Number of frames waiting to be read. (read-only)"""
+        return min(self._ring.counters[1] - self._tail, self._ring.capacity)
+
+    @property
+    def overruns(self) -> int:
+        """Frames overwritten by the server before this client read them. (read-only)"""
+        return self._overruns
+
+    def _catch_up(self, head: int) -> int:
+        tail = self._tail
+        if head - tail > self._ring.capacity:
+            self._overruns += head - tail - self._ring.capacity
+            tail = head - self._ring.capacity
+        return tail
+
+    def read_into(self, buf: array, timestamps: Optional[array] = None) -> int:
+        """Copy as many whole frames as fit into ``buf``, oldest first.
+
+        :param array buf: receives interleaved frames, one value per pin.
+        :param array timestamps: optional ``array('q')`` receiving one timestamp per frame.
+        :return: the number of frames copied.
+        """
+        ring = self._ring
+        channels = ring.channels
+        mask = ring.capacity - 1
+        tail = self._catch_up(ring.counters[1])
+        count = min(ring.counters[1] - tail, len(buf) // channels)
+        if timestamps is not None:
+            count = min(count, len(timestamps))
+        data = ring.data
+        for i in range(count):
+            slot = (tail + i) & mask
+            buf[i * channels : (i + 1) * channels] = array(
+                "H", data[slot * channels : (slot + 1) * channels]
+            )
+            if timestamps is not None:
+                timestamps[i] = ring.timestamps[slot]
+        # The server may have lapped us while copying; drop what it could have overwritten.
+        lapped = ring.counters[0] - ring.capacity - tail
+        if lapped > 0:
+            lost = min(lapped, count)
+            self._overruns += lost
+            count -= lost
+            buf[: count * channels] = buf[lost * channels : (lost + count) * channels]
+            if timestamps is not None:
+                timestamps[:count] = timestamps[lost : lost + count]
+            tail += lost
+        self._tail = tail + count
+        return count
+
+    def blocks(self, frames: int, poll: float = 0.001) -> Iterator[SampleBlock]:
+        """Yields consecutive blocks of ``frames`` frames as
+        `~adafruit_mcp3xxx.block.SampleBlock` objects whose ``data`` is a
+        :class:`memoryview` straight into shared memory, waiting for each block to be
+        written. A block stays valid until the server laps it, i.e. for about
+        ``capacity - frames`` frames' worth of time; copy it if it must live longer.
+
+        :param int frames: frames per block. Must divide the ring capacity.
+        :param float poll: seconds to sleep while waiting for the server.
+        """
+        ring = self._ring
+        if ring.capacity % frames:
+            raise ValueError("frames must divide the ring capacity.")
+        channels = ring.channels
+        mask = ring.capacity - 1
+        # Align to a block boundary so no block wraps around the end of the ring.
+        self._tail = -(-self._tail // frames) * frames
+        while True:
+            head = ring.counters[1]
+            tail = self._catch_up(head)
+            if tail != self._tail:
+                tail = -(-tail // frames) * frames
+            if head - tail < frames:
+                self._tail = tail
+                time.sleep(poll)
+                continue
+            slot = tail & mask
+            self._tail = tail + frames
+            yield SampleBlock(
+                ring.data[slot * channels : (slot + frames) * channels],
+                ring.pins,
+                ring.rate,
+                ring.bits,
+                ring.ref,
+                ring.timestamps[slot],
+            )
+
+    def close(self) -> None:
+        """Detach from the shared memory block. Release any blocks still held first."""
+        self._ring.release()
+
+    def __enter__(self) -> "SampleClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    """Command line entry point: ``python -m adafruit_mcp3xxx.server --help``."""
+    # Imported here so clients and tests do not need a board to import this module.
+    import board  # noqa: PLC0415
+    import busio  # noqa: PLC0415
+    import digitalio  # noqa: PLC0415
+
+    chips = {
+        "MCP3002": mcp3002.MCP3002,
+        "MCP3004": mcp3004.MCP3004,
+        "MCP3008": mcp3008.MCP3008,
+        "MCP3202": mcp3202.MCP3202,
+        "MCP3204": mcp3204.MCP3204,
+        "MCP3208": mcp3208.MCP3208,
+    }
+    parser = argparse.ArgumentParser(
+        prog="python -m adafruit_mcp3xxx.server",
+        description="Share MCP3xxx scans with other processes through shared memory.",
+    )
+    parser.add_argument("--chip", choices=sorted(chips), default="MCP3008")
+    parser.add_argument(
+        "--cs", nargs="+", default=["D5"], help="board pin driving each chip's chip select"
+    )
+    parser.add_argument("--pins", type=int, nargs="+", default=[0])
+    parser.add_argument("--rate", type=float, default=1000.0, help="frames per second")
+    parser.add_argument("--differential", action="store_true")
+    parser.add_argument("--baudrate", type=int, default=1_000_000)
+    parser.add_argument("--ref", type=float, default=3.3, help="reference voltage")
+    parser.add_argument("--name", default="mcp3xxx", help="shared memory block name")
+    parser.add_argument("--capacity", type=int, default=4096, help="ring size in frames")
+    options = parser.parse_args(args)
+
+    spi = busio.SPI(clock=board.SCK, MISO=board.MISO, MOSI=board.MOSI)
+    if len(options.cs) > 1:
+        spi = SharedBus(spi)
+    servers = []
+    try:
+        for number, pin in enumerate(options.cs):
+            cs = digitalio.DigitalInOut(getattr(board, pin))
+            mcp = chips[options.chip](spi, cs, options.ref, options.baudrate)
+            name = options.name if len(options.cs) == 1 else f"{options.name}-{number}"
+            servers.append(
+                AcquisitionServer(
+                    mcp, options.pins, options.rate, name, options.capacity, options.differential
+                )
+            )
+            print(f"Serving {options.chip} on {pin} pins {options.pins} as {name!r}")
+        # Each chip is served from its own thread; SharedBus keeps their scans apart.
+        threads = [threading.Thread(target=server.serve, daemon=True) for server in servers]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(0.5)
+        except KeyboardInterrupt:
+            for server in servers:
+                server.stop()
+            for thread in threads:
+                thread.join()
+    finally:
+        for server in servers:
+            server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.stats`
+================================================
+Bus instrumentation for `MCP3xxx`_, enabled with `MCP3xxx.enable_stats`.
+
+While enabled, the chip's :class:`~adafruit_bus_device.spi_device.SPIDevice` is wrapped
+so every transaction records how long it waited for the bus lock, how long configuring
+the bus and asserting chip select took, how long it spent inside ``write_readinto`` and
+how long it took overall. When disabled the original
+device is put back, so the read paths carry no instrumentation cost at all.
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+try:
+    from typing import Dict, Optional, Tuple
+
+    from adafruit_bus_device.spi_device import SPIDevice
+    from busio import SPI
+except ImportError:
+    pass
+
+
+class ReadStats:
+    """Counters collected while stats are enabled. All times are in nanoseconds.
+
+    :param commands: maps each command frame to its ``(pin, is_differential)`` so
+        transfers can be attributed to channels. Frames are told apart by their first two
+        bytes, which hold the start, SGL/DIFF and channel select bits of every chip.
+    """
+
+    # Latency bucket ``i`` counts transactions that took less than ``2 ** i`` microseconds;
+    # the last bucket also takes everything slower.
+    BUCKETS = 16
+
+    def __init__(self, commands: Dict[bytes, Tuple[int, bool]]) -> None:
+        self._commands = {
+            (frame[0] << 8) | frame[1]: channel for frame, channel in commands.items()
+        }
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters and restart the measurement window."""
+        self.started_ns = time.monotonic_ns()
+        self.transactions = 0
+        self.transfers = 0
+        self.lock_wait_ns = 0
+        self.setup_ns = 0
+        self.transfer_ns = 0
+        self.busy_ns = 0
+        self.channel_reads = {}
+        self.latency_histogram = [0] * self.BUCKETS
+
+    def _record_transfer(self, out_buffer: bytes, start: int, elapsed_ns: int) -> None:
+        self.transfers += 1
+        self.transfer_ns += elapsed_ns
+        channel = self._commands.get((out_buffer[start] << 8) | out_buffer[start + 1])
+        if channel is not None:
+            self.channel_reads[channel] = self.channel_reads.get(channel, 0) + 1
+
+    def _record_transaction(self, lock_wait_ns: int, setup_ns: int, elapsed_ns: int) -> None:
+        self.transactions += 1
+        self.lock_wait_ns += lock_wait_ns
+        self.setup_ns += setup_ns
+        self.busy_ns += elapsed_ns
+        bucket = 0
+        limit = 1000
+        while elapsed_ns >= limit and bucket < self.BUCKETS - 1:
+            bucket += 1
+            limit <<= 1
+        self.latency_histogram[bucket] += 1
+
+    def snapshot(self) -> dict:
+        """Returns the counters and derived rates as a plain dict, ready to export.
+
+        ``channel_rates`` maps ``(pin, is_differential)`` to reads per second and
+        ``bus_utilization`` is the fraction of wall time spent in ``write_readinto``.
+        """
+        elapsed = time.monotonic_ns() - self.started_ns
+        seconds = elapsed / 1_000_000_000 if elapsed else 1.0
+        return {
+            "elapsed_ns": elapsed,
+            "transactions": self.transactions,
+            "transfers": self.transfers,
+            "lock_wait_ns": self.lock_wait_ns,
+            "setup_ns": self.setup_ns,
+            "transfer_ns": self.transfer_ns,
+            "busy_ns": self.busy_ns,
+            "bus_utilization": self.transfer_ns / elapsed if elapsed else 0.0,
+            "channel_rates": {
+                channel: count / seconds for channel, count in self.channel_reads.items()
+            },
+            "latency_histogram": list(self.latency_histogram),
+        }
+
+
+class _InstrumentedBus:
+    """Proxy for :class:`busio.SPI` that notes when the bus lock was taken and times
+    every transfer."""
+
+    def __init__(self, spi: SPI, stats: ReadStats) -> None:
+        self._spi = spi
+        self._stats = stats
+        self.locked_ns = 0
+
+    def try_lock(self) -> bool:
+        locked = self._spi.try_lock()
+        if locked:
+            self.locked_ns = time.monotonic_ns()
+        return locked
+
+    def write_readinto(
+        self,
+        out_buffer: bytes,
+        in_buffer: bytearray,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        if out_end is None:
+            out_end = len(out_buffer)
+        if in_end is None:
+            in_end = len(in_buffer)
+        start = time.monotonic_ns()
+        self._spi.write_readinto(
+            out_buffer,
+            in_buffer,
+            out_start=out_start,
+            out_end=out_end,
+            in_start=in_start,
+            in_end=in_end,
+        )
+        elapsed = time.monotonic_ns() - start
+        self._stats._record_transfer(out_buffer, out_start, elapsed)
+
+    def __getattr__(self, name: str):
+        return getattr(self._spi, name)
+
+
+class _InstrumentedDevice:
+    """Proxy for :class:`~adafruit_bus_device.spi_device.SPIDevice` that times the
+    lock acquisition, the bus setup and the whole transaction. The device's own
+    ``__enter__`` and ``__exit__`` run unchanged on an `_InstrumentedBus`, which marks
+    the moment the lock was taken."""
+
+    def __init__(self, device: SPIDevice, stats: ReadStats) -> None:
+        self.device = device
+        self.spi = device.spi
+        """The bus itself, for code that drives it directly."""
+        self._stats = stats
+        self._bus = _InstrumentedBus(device.spi, stats)
+        device.spi = self._bus
+        self._entered_ns = 0
+        self._lock_wait_ns = 0
+        self._setup_ns = 0
+
+    def restore(self) -> SPIDevice:
+        """Returns the device with its own bus put back."""
+        self.device.spi = self.spi
+        return self.device
+
+    def __enter__(self) -> _InstrumentedBus:
+        start = time.monotonic_ns()
+        bus = self.device.__enter__()  # noqa: PLC2801
+        entered = time.monotonic_ns()
+        self._entered_ns = start
+        self._lock_wait_ns = self._bus.locked_ns - start
+        self._setup_ns = entered - self._bus.locked_ns
+        return bus
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        result = self.device.__exit__(exc_type, exc_val, exc_tb)  # noqa: PLC2801
+        elapsed = time.monotonic_ns() - self._entered_ns
+        self._stats._record_transaction(self._lock_wait_ns, self._setup_ns, elapsed)
+        return result
+
+    def __getattr__(self, name: str):
+        return getattr(self.device, name)
@@ -0,0 +1,374 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.stream`
+================================================
+Streaming sample blocks over the local network.
+
+Each `~adafruit_mcp3xxx.block.SampleBlock` travels as one binary packet: a fixed header
+with the sender's session id and a sequence number, the chip type and resolution, the
+timestamp of the first frame, the frame rate, the reference voltage and the channel
+map, followed by the raw codes as little-endian ``uint16``. Packets go out over UDP
+(unicast or multicast) with `UDPSender`, or to every connected client with
+`TCPSender`. `UDPReceiver` and `TCPReceiver` decode them and count the blocks lost in
+between, using the sequence numbers. Every sender picks a random session id, so a
+receiver notices a restarted sender, whose sequence starts again at 0, and follows it.
+
+.. code-block:: python
+
+    # On the Raspberry Pi with the chip
+    sender = UDPSender(("239.0.0.1", 5005), chip="MCP3008")
+    stream(SampleScheduler(mcp, (0, 1, 2, 3), 1000), sender, frames=64)
+
+    # Anywhere on the network
+    receiver = UDPReceiver(("239.0.0.1", 5005))
+    for sequence, block in receiver:
+        print(sequence, block.as_numpy().mean(axis=0), receiver.missed)
+
+Keep UDP blocks under about 1400 bytes (e.g. 64 frames of 8 channels is 1080 bytes) so
+they are not fragmented.
+
+.. note:: This module is meant for CPython.
+
+* Author(s): Adafruit Industries
+"""
+
+import ipaddress
+import os
+import socket
+import struct
+import sys
+from array import array
+
+from .block import SampleBlock
+from .scheduler import SampleScheduler
+
+try:
+    from typing import Iterator, Optional, Tuple
+except ImportError:
+    pass
+
+MAGIC = b"MCPB"
+VERSION = 2
+# magic, version, bits, channels, frames, session, sequence, chip, first timestamp, rate,
+# reference
+_HEADER = "<4sBBHHxxII8sqdf"
+_HEADER_SIZE = struct.calcsize(_HEADER)
+_LENGTH = "<I"
+_MAX_DATAGRAM = 65507
+
+
+def encode_block(block: SampleBlock, sequence: int, chip: str = "", session: int = 0) -> bytes:
+    """Returns the packet carrying ``block``.
+
+    :param SampleBlock block: raw codes to send.
+    :param int sequence: the block's sequence number, wrapping at ``2 ** 32``.
+    :param str chip: the chip type, e.g. ``"MCP3008"``.
+    :param int session: 32-bit id of the sender's run, so receivers notice a restart.
+    """
+    channels = len(block.channels)
+    header = struct.pack(
+        _HEADER,
+        MAGIC,
+        VERSION,
+        block.bits,
+        channels,
+        block.frames,
+        session & 0xFFFFFFFF,
+        sequence & 0xFFFFFFFF,
+        chip.encode(),
+        block.timestamp_ns or 0,
+        block.sample_rate,
+        block.reference_voltage,
+    )
+    data = memoryview(block.data)
+    if data.format != "H":
+        raise TypeError("Only blocks of raw uint16 codes can be sent.")
+    if sys.byteorder == "big":
+        data = array("H", data)
+        data.byteswap()
+    return header + bytes(block.channels) + data
+
+
+def decode_block(packet: bytes) -> Tuple[int, int, str, SampleBlock]:
+    """Returns ``(session, sequence, chip, block)`` decoded from a packet made by
+    `encode_block`. Raises :class:`ValueError` if ``packet`` is not a whole block."""
+    if len(packet) < _HEADER_SIZE:
+        raise ValueError("Packet is shorter than a block header.")
+    (magic, version, bits, channels, frames, session, sequence, chip, timestamp, rate, ref) = (
+        struct.unpack_from(_HEADER, packet)
+    )
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a version {VERSION} sample block.")
+    if len(packet) != _HEADER_SIZE + channels + 2 * channels * frames:
+        raise ValueError("Packet length does not match its block header.")
+    pins = tuple(packet[_HEADER_SIZE : _HEADER_SIZE + channels])
+    start = _HEADER_SIZE + channels
+    data = array("H")
+    data.frombytes(packet[start : start + 2 * channels * frames])
+    if sys.byteorder == "big":
+        data.byteswap()
+    block = SampleBlock(data, pins, rate, bits, ref, timestamp or None)
+    return session, sequence, chip.rstrip(b"\0").decode(), block
+
+
+class _Sender:
+    """Numbering shared by the senders, which provide ``_send(packet)`` and ``close()``."""
+
+    def __init__(self, chip: str) -> None:
+        self.chip = chip
+        self.session = int.from_bytes(os.urandom(4), "little")
+        """Random id of this sender, written into every block."""
+        self.sequence = 0
+        """Sequence number of the next block."""
+
+    def send(self, block: SampleBlock) -> None:
+        """Send one block with the next sequence number."""
+        self._send(encode_block(block, self.sequence, self.chip, self.session))
+        self.sequence = (self.sequence + 1) & 0xFFFFFFFF
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class UDPSender(_Sender):
+    """Sends blocks as UDP datagrams, one block per datagram.
+
+    :param address: ``(host, port)`` to send to; a multicast group or a unicast host.
+    :param str chip: the chip type written into every block, e.g. ``"MCP3008"``.
+    :param int ttl: multicast time-to-live. 1 keeps the stream on the local network.
+    """
+
+    def __init__(self, address: Tuple[str, int], chip: str = "", ttl: int = 1) -> None:
+        super().__init__(chip)
+        self._address = address
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+
+    def _send(self, packet: bytes) -> None:
+        if len(packet) > _MAX_DATAGRAM:
+            raise ValueError("Block is too large for one datagram.")
+        self._socket.sendto(packet, self._address)
+
+    def close(self) -> None:
+        """Close the socket."""
+        self._socket.close()
+
+
+class TCPSender(_Sender):
+    """Listens for TCP clients and sends every block to all of them, each packet
+    prefixed with its length. Clients that disconnect or fall too far behind to accept
+    a whole packet are dropped.
+
+    :param address: ``(host, port)`` to listen on.
+    :param str chip: the chip type written into every block, e.g. ``"MCP3008"``.
+    """
+
+    def __init__(self, address: Tuple[str, int], chip: str = "") -> None:
+        super().__init__(chip)
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind(address)
+        self._listener.listen()
+        self._listener.setblocking(False)
+        self._clients = []
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """The address the sender listens on. (read-only)"""
+        return self._listener.getsockname()
+
+    @property
+    def clients(self) -> int:
+        """Number of connected clients. (read-only)"""
+        return len(self._clients)
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                client, _ = self._listener.accept()
+            except BlockingIOError:
+                return
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client.settimeout(0)
+            self._clients.append(client)
+
+    def _send(self, packet: bytes) -> None:
+        self._accept()
+        message = struct.pack(_LENGTH, len(packet)) + packet
+        for client in list(self._clients):
+            try:
+                sent = client.send(message)
+            except OSError:
+                sent = 0
+            if sent != len(message):
+                # A partial packet would corrupt the stream, so drop the client.
+                self._clients.remove(client)
+                client.close()
+
+    def close(self) -> None:
+        """Disconnect every client and stop listening."""
+        for client in self._clients:
+            client.close()
+        self._clients = []
+        self._listener.close()
+
+
+def stream(
+    scheduler: SampleScheduler,
+    sender: _Sender,
+    frames: int = 64,
+    count: Optional[int] = None,
+) -> None:
+    """Capture blocks of ``frames`` frames with ``scheduler`` and send each of them.
+    The blocks come from one continuous schedule (see `SampleScheduler.blocks`), so
+    time spent sending is caught up, and deadlines it overruns by more than a block
+    are counted in the scheduler's ``stats.missed``.
+
+    :param SampleScheduler scheduler: the scheduler sampling the chip.
+    :param sender: a `UDPSender` or `TCPSender`.
+    :param int frames: frames per block.
+    :param int count: number of blocks to send. Runs forever if omitted.
+    """
+    for block in scheduler.blocks(frames, count):
+        sender.send(block)
+
+
+class _Receiver:
+    """Sequence tracking shared by the receivers, which provide ``_packet(timeout)`` and
+    ``close()``."""
+
+    def __init__(self) -> None:
+        self.chip = ""
+        """Chip type of the last block received."""
+        self.session = None
+        """Session id of the sender of the last block received."""
+        self.restarts = 0
+        """Times the stream switched to a new sender session."""
+        self.sequence = None
+        """Sequence number of the last block received."""
+        self.missed = 0
+        """Blocks skipped over by gaps in the sequence numbers."""
+        self.late = 0
+        """Blocks that arrived after a later block and were discarded."""
+        self.invalid = 0
+        """Packets that were not whole blocks and were discarded."""
+
+    def receive(self, timeout: Optional[float] = None) -> Tuple[int, SampleBlock]:
+        """Wait for the next block in sequence and return ``(sequence, block)``. Packets
+        that are not whole blocks are counted in `invalid` and skipped.
+
+        :param float timeout: seconds to wait for each packet. Raises
+            :class:`TimeoutError` when it passes. Waits forever if omitted.
+        """
+        while True:
+            try:
+                packet = self._packet(timeout)
+            except socket.timeout:
+                # Only an alias of TimeoutError from Python 3.10 on.
+                raise TimeoutError("No block received in time.") from None
+            try:
+                session, sequence, chip, block = decode_block(packet)
+            except ValueError:
+                # A stray or truncated datagram, not from a sender.
+                self.invalid += 1
+                continue
+            if session != self.session:
+                # A new or restarted sender: follow it from this block on.
+                if self.session is not None:
+                    self.restarts += 1
+                self.session = session
+                self.sequence = None
+            if self.sequence is not None:
+                gap = (sequence - self.sequence - 1) & 0xFFFFFFFF
+                if gap >= 0x80000000:
+                    # Duplicate or reordered datagram from before the last block.
+                    self.late += 1
+                    continue
+                self.missed += gap
+            self.sequence = sequence
+            self.chip = chip
+            return sequence, block
+
+    def __iter__(self) -> Iterator[Tuple[int, SampleBlock]]:
+        while True:
+            yield self.receive()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class UDPReceiver(_Receiver):
+    """Receives blocks sent by a `UDPSender`.
+
+    :param address: ``(host, port)`` the sender sends to. A multicast group is joined
+        automatically; any other host, including ``""`` for all interfaces, is bound as
+        a unicast address.
+    :param str interface: address of the local interface to receive multicast on.
+    """
+
+    def __init__(self, address: Tuple[str, int], interface: str = "0.0.0.0") -> None:
+        super().__init__()
+        host, port = address
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        group = socket.gethostbyname(host) if host else None
+        multicast = group is not None and ipaddress.ip_address(group).is_multicast
+        self._socket.bind(("" if multicast else host, port))
+        if multicast:
+            membership = socket.inet_aton(group) + socket.inet_aton(interface)
+            self._socket.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership)
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """The address the receiver is bound to. (read-only)"""
+        return self._socket.getsockname()
+
+    def _packet(self, timeout: Optional[float]) -> bytes:
+        self._socket.settimeout(timeout)
+        return self._socket.recv(_MAX_DATAGRAM)
+
+    def close(self) -> None:
+        """Close the socket."""
+        self._socket.close()
+
+
+class TCPReceiver(_Receiver):
+    """Receives blocks from a `TCPSender`.
+
+    :param address: ``(host, port)`` the sender listens on.
+    """
+
+    def __init__(self, address: Tuple[str, int]) -> None:
+        super().__init__()
+        self._socket = socket.create_connection(address)
+
+    def _read_exactly(self, size: int) -> bytes:
+        data = bytearray(size)
+        view = memoryview(data)
+        received = 0
+        while received < size:
+            count = self._socket.recv_into(view[received:])
+            if not count:
+                raise ConnectionError("The sender closed the connection.")
+            received += count
+        return bytes(data)
+
+    def _packet(self, timeout: Optional[float]) -> bytes:
+        self._socket.settimeout(timeout)
+        (size,) = struct.unpack(_LENGTH, self._read_exactly(struct.calcsize(_LENGTH)))
+        # Once a packet has started, finish it so the stream stays in step.
+        self._socket.settimeout(None)
+        return self._read_exactly(size)
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._socket.close()
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.sweep`
+================================================
+Signed differential readings from both polarities of every pair.
+
+The chips clamp a differential conversion at zero, so ``IN+ - IN-`` is only useful when
+``IN+`` is higher. `DifferentialSweep` reads every pair in the chip's `MCP3xxx.DIFF_PINS`
+both ways round, back to back, plus any single-ended channels, all in one bus
+transaction. At most one polarity of a pair reads above zero, so subtracting them gives
+the signed difference, e.g. of a bridge sensor. The same sweep serves pseudo-differential
+inputs, where ``IN-`` sits at a quiet reference near ground.
+
+.. code-block:: python
+
+    sweep = DifferentialSweep(mcp, single_ended=(4, 5))
+    raw = sweep.read()
+    for (positive, negative), code in zip(sweep.pairs, sweep.signed(raw)):
+        print(positive, negative, code * mcp.reference_voltage / (1 << mcp.BITS))
+
+* Author(s): Adafruit Industries
+"""
+
+from array import array
+
+from .mcp3xxx import MCP3xxx, _check_mcp
+
+try:
+    from typing import Optional, Sequence
+except ImportError:
+    pass
+
+
+class DifferentialSweep:
+    """Reads both polarities of every differential pair, then ``single_ended`` pins.
+
+    :param MCP3xxx mcp: the chip to read.
+    :param single_ended: pins to read single-ended after the pairs. Defaults to none.
+    """
+
+    def __init__(self, mcp: MCP3xxx, single_ended: Sequence[int] = ()) -> None:
+        _check_mcp(mcp)
+        self._mcp = mcp
+        pairs = sorted({tuple(sorted(pins)) for pins in mcp.DIFF_PINS})
+        self.pairs = tuple(pairs)
+        """``(positive, negative)`` pins of each pair, in reading order."""
+        self.single_ended = tuple(single_ended)
+        """Pins read single-ended after the pairs."""
+        settings = []
+        for positive, negative in pairs:
+            settings.append(mcp.DIFF_PINS[(positive, negative)])
+            settings.append(mcp.DIFF_PINS[(negative, positive)])
+        self._commands = mcp.pack_commands(settings, True) + mcp.pack_commands(
+            self.single_ended, False
+        )
+        self._count = len(settings) + len(self.single_ended)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def read(self, buf: Optional[array] = None) -> array:
+        """Run the sweep in one bus transaction.
+
+        :param array buf: optional ``array('H')`` with one entry per reading.
+        :return: ``buf`` holding, for each pair, ``positive - negative`` and then
+            ``negative - positive`` (each clamped at zero), followed by the
+            single-ended readings.
+        """
+        return self._mcp.read_packed(self._commands, buf)
+
+    def signed(self, raw: Sequence[int], out: Optional[array] = None) -> array:
+        """Returns the signed difference ``positive - negative`` of every pair, in codes.
+
+        :param raw: readings from `read`.
+        :param array out: optional ``array('h')`` with one entry per pair.
+        """
+        count = len(self.pairs)
+        if out is None:
+            out = array("h", bytes(2 * count))
+        for i in range(count):
+            out[i] = raw[2 * i] - raw[2 * i + 1]
+        return out
@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+:py:mod:`~adafruit_mcp3xxx.tuning`
+================================================
+Find the fastest SPI clock a chip reads reliably at on a particular board.
+
+The datasheet limits in `MCP3xxx.MAX_BAUDRATE` assume ideal wiring; long leads,
+breadboards and level shifters can lower the usable clock. `autotune_baudrate` steps
+the clock up from a known-good starting point while checking a reference channel, and
+settles on the fastest clock whose readings still match.
+
+* Author(s): Adafruit Industries
+"""
+
+from array import array
+
+from .mcp3xxx import MCP3xxx
+
+try:
+    from typing import Optional, Sequence
+except ImportError:
+    pass
+
+# Candidate clocks tried between the starting baudrate and the datasheet limit.
+LADDER = (
+    100_000,
+    250_000,
+    500_000,
+    750_000,
+    1_000_000,
+    1_350_000,
+    1_800_000,
+    2_000_000,
+    2_500_000,
+    3_200_000,
+    3_600_000,
+)
+
+
+def _measure(mcp: MCP3xxx, pin: int, samples: array) -> tuple:
+    mcp.read_into(pin, samples)
+    low = min(samples)
+    high = max(samples)
+    return sum(samples) / len(samples), high - low
+
+
+def autotune_baudrate(
+    mcp: MCP3xxx,
+    pin: int,
+    vdd: float = 3.3,
+    expected: Optional[int] = None,
+    tolerance: int = 4,
+    samples: int = 32,
+    ladder: Sequence[int] = LADDER,
+) -> int:
+    """Step the clock of ``mcp`` up towards `MCP3xxx.max_baudrate` and leave it at the
+    fastest setting whose readings of ``pin`` stay consistent.
+
+    A clock is accepted when the mean of ``samples`` readings is within ``tolerance``
+    LSBs of the reference and their spread is no more than ``tolerance`` LSBs above the
+    spread measured at the starting clock. The search stops at the first clock that
+    fails, because a marginal bus rarely recovers at higher clocks.
+
+    :param MCP3xxx mcp: the chip to tune. Its current baudrate must read correctly.
+    :param int pin: a single-ended channel with a steady input, e.g. tied to a reference.
+    :param float vdd: supply voltage of the chip, used for the datasheet limit.
+    :param int expected: raw reading the reference channel should give. Defaults to
+        the mean measured at the starting clock.
+    :param int tolerance: accepted error in LSBs.
+    :param int samples: conversions taken at each clock.
+    :param ladder: candidate clocks in Hz. The datasheet limit is always tried last.
+    :return: the baudrate chosen, which is also left set on ``mcp``.
+    """
+    limit = mcp.max_baudrate(vdd)
+    best = mcp.baudrate
+    buf = array("H", bytes(2 * samples))
+    reference, base_spread = _measure(mcp, pin, buf)
+    if expected is not None:
+        if abs(reference - expected) > tolerance:
+            raise RuntimeError("Reference channel does not read as expected at the starting clock.")
+        reference = expected
+    candidates = [rate for rate in ladder if best < rate < limit]
+    candidates.sort()
+    if best < limit:
+        candidates.append(limit)
+    for rate in candidates:
+        mcp.baudrate = rate
+        mean, spread = _measure(mcp, pin, buf)
+        if abs(mean - reference) > tolerance or spread > base_spread + tolerance:
+            break
+        best = rate
+    mcp.baudrate = best
+    return best
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""Measure the Python overhead of every driver's read paths without hardware.
+
+Each chip is emulated on a software SPI bus. The "bus only" row is the cost of one
+emulated transfer on its own; subtract it (times the number of conversions) from the
+other rows to get the driver's own overhead. The modelled sample rate is what the
+chip could reach at BAUDRATE on a real bus."""
+
+import time
+from array import array
+
+from adafruit_mcp3xxx.analog_in import AnalogIn
+from adafruit_mcp3xxx.emulator import EmulatedMCP3xxx, EmulatedSPI
+from adafruit_mcp3xxx.mcp3002 import MCP3002
+from adafruit_mcp3xxx.mcp3004 import MCP3004
+from adafruit_mcp3xxx.mcp3008 import MCP3008
+from adafruit_mcp3xxx.mcp3202 import MCP3202
+from adafruit_mcp3xxx.mcp3204 import MCP3204
+from adafruit_mcp3xxx.mcp3208 import MCP3208
+
+ITERATIONS = 2_000
+REPEATS = 5
+BAUDRATE = 1_000_000
+
+
+def bench(name, func, conversions=1):
+    best = None
+    for _ in range(REPEATS):
+        start = time.monotonic_ns()
+        for _ in range(ITERATIONS):
+            func()
+        elapsed = time.monotonic_ns() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    per_call = best / ITERATIONS / 1000
+    print(f"  {name:<22}{per_call:>9.2f} us/call{per_call / conversions:>9.2f} us/conversion")
+
+
+for chip_class in (MCP3002, MCP3004, MCP3008, MCP3202, MCP3204, MCP3208):
+    spi = EmulatedSPI()
+    chip = EmulatedMCP3xxx(spi, chip_class, inputs=[1.0] * chip_class.CHANNELS)
+    mcp = chip_class(spi, chip.chip_select, baudrate=BAUDRATE)
+    chan = AnalogIn(mcp, 0)
+    channels = chip_class.CHANNELS
+    values = array("H", [0] * channels)
+    burst = array("H", [0] * 64)
+    command = mcp.command(0)
+    response = bytearray(len(command))
+
+    def bus_only(spi=spi, command=command, response=response):
+        spi.write_readinto(command, response)
+
+    print(chip_class.__name__)
+    chip.chip_select.value = False
+    bench("bus only", bus_only)
+    chip.chip_select.value = True
+    bench("read()", lambda: mcp.read(0))
+    bench("AnalogIn.value", lambda: chan.value)
+    bench("AnalogIn.voltage", lambda: chan.voltage)
+    bench("read_many()", lambda: mcp.read_many(range(channels), values), channels)
+    bench("scan()", lambda: mcp.scan(values), channels)
+    bench("read_into() x64", lambda: mcp.read_into(0, burst), len(burst))
+    spi.elapsed_ns = 0
+    chip.conversions = 0
+    mcp.read_into(0, burst)
+    print(f"  modelled sample rate  {chip.sample_rate:>9.0f} conversions/s at {BAUDRATE} Hz")
@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+from array import array
+
+import board
+import busio
+import digitalio
+
+import adafruit_mcp3xxx.mcp3008 as MCP
+
+# create the spi bus
+spi = busio.SPI(clock=board.SCK, MISO=board.MISO, MOSI=board.MOSI)
+
+# create the cs (chip select)
+cs = digitalio.DigitalInOut(board.D5)
+
+# create the mcp object
+mcp = MCP.MCP3008(spi, cs)
+
+# preallocate the result buffer so repeated scans do not allocate
+values = array("H", [0] * mcp.CHANNELS)
+
+# read all eight channels while holding the bus once
+mcp.scan(values)
+for channel, value in enumerate(values):
+    print("P" + str(channel) + " Raw ADC Value: ", value)
+
+# or just a subset of channels, in any order
+mcp.read_many((MCP.P7, MCP.P0), values)
+print("P7, P0: ", values[0], values[1])
@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Shared fixtures: every chip driver wired to its emulated chip."""
+
+import pytest
+
+from adafruit_mcp3xxx.emulator import EmulatedMCP3xxx, EmulatedSPI
+from adafruit_mcp3xxx.mcp3002 import MCP3002
+from adafruit_mcp3xxx.mcp3004 import MCP3004
+from adafruit_mcp3xxx.mcp3008 import MCP3008
+from adafruit_mcp3xxx.mcp3202 import MCP3202
+from adafruit_mcp3xxx.mcp3204 import MCP3204
+from adafruit_mcp3xxx.mcp3208 import MCP3208
+
+CHIPS = (MCP3002, MCP3004, MCP3008, MCP3202, MCP3204, MCP3208)
+
+
+def _emulate(chip_class, inputs=None, ref_voltage=3.3, baudrate=1_000_000):
+    """Returns ``(mcp, chip)``: a driver and the emulated chip it talks to."""
+    if inputs is None:
+        # Distinct, well separated voltages so a wrong channel shows up as a wrong code.
+        inputs = [
+            ref_voltage * (channel + 1) / (chip_class.CHANNELS + 2)
+            for channel in range(chip_class.CHANNELS)
+        ]
+    spi = EmulatedSPI()
+    chip = EmulatedMCP3xxx(spi, chip_class, inputs=inputs, ref_voltage=ref_voltage)
+    return chip_class(spi, chip.chip_select, ref_voltage, baudrate), chip
+
+
+@pytest.fixture(params=CHIPS, ids=lambda chip_class: chip_class.__name__)
+def chip_class(request):
+    return request.param
+
+
+@pytest.fixture
+def emulate():
+    """The factory behind `emulated`, for tests that need particular inputs."""
+    return _emulate
+
+
+@pytest.fixture
+def emulated(chip_class):
+    return _emulate(chip_class)
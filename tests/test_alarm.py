@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Window comparator alarms and their debounce."""
+
+import pytest
+
+from adafruit_mcp3xxx.alarm import HIGH, LOW, NORMAL, AlarmMonitor
+from adafruit_mcp3xxx.mcp3008 import MCP3008
+
+# Codes of the 10 bit MCP3008 at 3.3 V: limits at 1.0 V and 2.0 V.
+BELOW, INSIDE, ABOVE = 100, 450, 900
+
+
+@pytest.fixture
+def monitor(emulate):
+    mcp, _ = emulate(MCP3008)
+    events = []
+    monitor = AlarmMonitor(
+        mcp, (3,), low=1.0, high=2.0, debounce=3, callback=lambda *event: events.append(event)
+    )
+    monitor.events = events
+    return monitor
+
+
+def check(monitor, codes):
+    return [monitor.check([code]) for code in codes]
+
+
+def test_debounce_holds_for_consecutive_scans(monitor):
+    assert check(monitor, (ABOVE, ABOVE)) == [0, 0]
+    assert monitor.states[0] == NORMAL
+    assert check(monitor, (ABOVE,)) == [1]
+    assert monitor.states[0] == HIGH
+    assert monitor.active
+    assert monitor.events == [(3, HIGH, ABOVE)]
+
+
+def test_interrupted_condition_starts_over(monitor):
+    check(monitor, (ABOVE, ABOVE, INSIDE, ABOVE, ABOVE))
+    assert monitor.states[0] == NORMAL
+    # A different condition also restarts the count.
+    check(monitor, (BELOW, BELOW, ABOVE, BELOW, BELOW))
+    assert monitor.states[0] == NORMAL
+    assert monitor.events == []
+    check(monitor, (BELOW,))
+    assert monitor.states[0] == LOW
+    assert monitor.events == [(3, LOW, BELOW)]
+
+
+def test_return_to_normal_is_debounced(monitor):
+    check(monitor, (ABOVE,) * 3)
+    check(monitor, (INSIDE, INSIDE, ABOVE, INSIDE, INSIDE))
+    assert monitor.states[0] == HIGH
+    check(monitor, (INSIDE,))
+    assert monitor.states[0] == NORMAL
+    assert not monitor.active
+    assert monitor.events == [(3, HIGH, ABOVE), (3, NORMAL, INSIDE)]
+
+
+def test_poll_reads_the_chip(emulate):
+    mcp, chip = emulate(MCP3008, inputs=[0.0] * 8)
+    monitor = AlarmMonitor(mcp, (0, 1), low=0.5, high=(1.0, None))
+    assert monitor.poll() == 2
+    assert list(monitor.states) == [LOW, LOW]
+    chip.set_input(0, 3.0)
+    chip.set_input(1, 3.0)
+    assert monitor.poll() == 2
+    assert list(monitor.states) == [HIGH, NORMAL]
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Round-robin sweeps of several chips sharing one bus."""
+
+import pytest
+
+from adafruit_mcp3xxx.emulator import EmulatedMCP3xxx, EmulatedSPI
+from adafruit_mcp3xxx.mcp3xxx_array import MCP3xxxArray
+from adafruit_mcp3xxx.mcp3004 import MCP3004
+from adafruit_mcp3xxx.mcp3008 import MCP3008
+
+
+class RecordingSPI(EmulatedSPI):
+    """Notes which chip every transfer selected and the command it sent."""
+
+    def __init__(self):
+        super().__init__()
+        self.log = []
+
+    def write_readinto(self, out_buffer, in_buffer, **kwargs):
+        selected = [number for number, chip in enumerate(self._chips) if chip.selected]
+        self.log.append((selected, bytes(out_buffer)))
+        super().write_readinto(out_buffer, in_buffer, **kwargs)
+
+
+@pytest.fixture
+def chips():
+    spi = RecordingSPI()
+    first = EmulatedMCP3xxx(spi, MCP3008, inputs=[0.2 * (pin + 1) for pin in range(8)])
+    second = EmulatedMCP3xxx(spi, MCP3004, inputs=[3.2 - 0.3 * pin for pin in range(4)])
+    return spi, (
+        MCP3008(spi, first.chip_select, 3.3, 1_000_000),
+        MCP3004(spi, second.chip_select, 3.3, 500_000),
+    )
+
+
+def test_scan_matches_read(chips):
+    _, mcps = chips
+    array = MCP3xxxArray(mcps)
+    codes = array.scan()
+    assert len(codes) == array.channels == 12
+    for number, mcp in enumerate(mcps):
+        for pin in range(mcp.CHANNELS):
+            assert codes[array.channel_index(number, pin)] == mcp.read(pin)
+
+
+def test_sweep_is_round_robin(chips):
+    spi, mcps = chips
+    MCP3xxxArray(mcps).scan()
+    expected = []
+    for pin in range(8):
+        for number, mcp in enumerate(mcps):
+            if pin < mcp.CHANNELS:
+                expected.append(([number], mcp.command(pin)))
+    assert spi.log == expected
+    # The whole sweep runs at the slower chip's clock.
+    assert spi.baudrate == 500_000
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Per-call cost of every driver's read paths against emulated chips.
+
+Run with ``pytest tests/test_benchmark.py --benchmark-autosave`` and compare later runs
+with ``--benchmark-compare`` to catch regressions in the hot paths. The emulated
+transfer itself is included in every measurement; ``test_bus_only`` measures it alone.
+"""
+
+from array import array
+
+import pytest
+
+from adafruit_mcp3xxx.analog_in import AnalogIn
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_bus_only(benchmark, emulated):
+    mcp, chip = emulated
+    spi = mcp._spi_device.spi
+    command = mcp.command(0)
+    response = bytearray(len(command))
+    chip.chip_select.value = False
+    benchmark(spi.write_readinto, command, response)
+
+
+def test_read(benchmark, emulated):
+    mcp, _ = emulated
+    benchmark(mcp.read, 0)
+
+
+def test_read_command(benchmark, emulated):
+    mcp, _ = emulated
+    benchmark(mcp.read_command, mcp.command(0))
+
+
+def test_analog_in_value(benchmark, emulated):
+    chan = AnalogIn(emulated[0], 0)
+    benchmark(lambda: chan.value)
+
+
+def test_analog_in_voltage(benchmark, emulated):
+    chan = AnalogIn(emulated[0], 0)
+    benchmark(lambda: chan.voltage)
+
+
+def test_read_many(benchmark, emulated):
+    mcp, _ = emulated
+    pins = range(mcp.CHANNELS)
+    benchmark(mcp.read_many, pins, array("H", bytes(2 * mcp.CHANNELS)))
+
+
+def test_scan(benchmark, emulated):
+    mcp, _ = emulated
+    benchmark(mcp.scan, array("H", bytes(2 * mcp.CHANNELS)))
+
+
+def test_read_into(benchmark, emulated):
+    mcp, _ = emulated
+    benchmark(mcp.read_into, 0, array("H", bytes(2 * 64)))
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Zero-copy export of sample blocks."""
+
+from array import array
+
+import pytest
+
+from adafruit_mcp3xxx.block import SampleBlock
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def block():
+    return SampleBlock(array("H", [1, 2, 3, 4, 5, 6]), (0, 1), 100, 10, 3.3)
+
+
+def test_numpy_shares_memory(block):
+    codes = np.asarray(block)
+    assert codes.dtype == np.uint16
+    assert codes.tolist() == [1, 2, 3, 4, 5, 6]
+    block.data[0] = 7
+    assert codes[0] == 7
+    assert block.as_numpy().shape == (3, 2)
+
+
+def test_numpy_copy_and_dtype(block):
+    assert np.array(block, copy=True).tolist() == list(block.data)
+    assert np.asarray(block, dtype=np.float32).dtype == np.float32
+    codes = np.array(block, copy=True)
+    block.data[0] = 9
+    assert codes[0] == 1
+
+
+def test_memoryview_shares_memory(block):
+    view = block.memoryview()
+    assert view.tobytes() == block.data.tobytes()
+    block.data[1] = 8
+    assert view[1] == 8
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Readings served from a scan until it goes stale."""
+
+import pytest
+
+from adafruit_mcp3xxx import cache
+from adafruit_mcp3xxx.analog_in import AnalogIn
+from adafruit_mcp3xxx.mcp3008 import MCP3008
+
+
+class Clock:
+    """Stands in for the time module, advanced by hand."""
+
+    def __init__(self):
+        self.now = 0
+
+    def monotonic_ns(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache, "time", clock)
+    return clock
+
+
+def test_stale_after_max_age(emulate, clock):
+    mcp, chip = emulate(MCP3008, inputs=[1.0, 2.0] + [0.0] * 6)
+    readings = cache.ReadCache(mcp, max_age=0.01)
+    first = readings.read(0)
+    assert readings.read(1) == mcp.read(1)
+    chip.set_input(0, 3.0)
+    clock.now = 10_000_000
+    # Still fresh at exactly max_age: the old reading is served.
+    assert readings.read(0) == first
+    assert (readings.hits, readings.misses) == (2, 1)
+    clock.now += 1
+    assert readings.read(0) == mcp.read(0) != first
+    assert (readings.hits, readings.misses) == (2, 2)
+
+
+def test_single_ended_and_differential_age_apart(emulate, clock):
+    mcp, _ = emulate(MCP3008, inputs=[2.0, 1.0] + [0.0] * 6)
+    readings = cache.ReadCache(mcp, max_age=1.0)
+    assert readings.read(0) == mcp.read(0)
+    assert readings.read(0, True) == mcp.read(0, True)
+    assert readings.misses == 2
+    readings.invalidate()
+    readings.read(0, True)
+    assert readings.misses == 3
+
+
+def test_analog_in_uses_cache(emulate, clock):
+    mcp, chip = emulate(MCP3008, inputs=[1.0] + [0.0] * 7)
+    readings = cache.ReadCache(mcp, max_age=0.01)
+    channel = AnalogIn(mcp, 0, cache=readings)
+    before = channel.value
+    chip.set_input(0, 2.0)
+    assert channel.value == before
+    clock.now = 20_000_000
+    assert channel.value != before
+    assert readings.misses == 2
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Capture files written and read back through the memory-mapped reader."""
+
+import struct
+from array import array
+
+import pytest
+
+from adafruit_mcp3xxx.capture import CaptureReader, CaptureWriter
+from adafruit_mcp3xxx.mcp3208 import MCP3208
+
+PINS = (5, 2, 7)
+
+
+@pytest.mark.parametrize("packed", (True, False))
+def test_round_trip(tmp_path, emulate, packed):
+    mcp, _ = emulate(MCP3208)
+    frames = array("H", [(i * 37) % 4096 for i in range(3 * 20)])
+    path = tmp_path / "capture.mcpx"
+    with open(path, "wb") as stream:
+        writer = CaptureWriter(stream, mcp, PINS, rate=10, packed=packed)
+        writer.write(frames)
+    with CaptureReader(path) as capture:
+        assert len(capture) == 20
+        assert capture.pins == PINS
+        assert list(capture.read()) == list(frames)
+        assert list(capture.read(2, 4, pins=(7,))) == [frames[8], frames[11]]
+        assert list(capture.slice_time(1.0, 1.2, pins=(5,))) == [frames[30], frames[33]]
+
+
+def test_unpacked_records_are_little_endian(tmp_path, emulate):
+    mcp, _ = emulate(MCP3208)
+    path = tmp_path / "capture.mcpx"
+    with open(path, "wb") as stream:
+        CaptureWriter(stream, mcp, PINS, rate=10, packed=False).write(array("H", [1, 2, 0x0ABC]))
+    data = path.read_bytes()
+    assert struct.unpack("<3H", data[-6:]) == (1, 2, 0x0ABC)
+
+
+@pytest.mark.parametrize("packed", (True, False))
+def test_rejects_bad_frames(tmp_path, emulate, packed):
+    mcp, _ = emulate(MCP3208)
+    with open(tmp_path / "capture.mcpx", "wb") as stream:
+        writer = CaptureWriter(stream, mcp, PINS, rate=10, packed=packed)
+        with pytest.raises(ValueError):
+            writer.write(array("H", [1, 2, 3, 4]))
+        with pytest.raises(ValueError):
+            writer.write(array("H", [1, 4096, 3]))
+        assert writer.frames == 0
+
+
+def test_oversampled_codes(tmp_path, emulate):
+    mcp, _ = emulate(MCP3208)
+    frames = array("H", [0x3FFF, 0, 0x2AAA, 1, 0x1555, 0x3FFE])
+    path = tmp_path / "capture.mcpx"
+    with open(path, "wb") as stream:
+        CaptureWriter(stream, mcp, PINS, rate=10, bits=14).write(frames)
+    with CaptureReader(path) as capture:
+        assert capture.bits == 14
+        assert list(capture.read()) == list(frames)
@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Fixed-point conversion against exact rational results."""
+
+import pytest
+
+from adafruit_mcp3xxx.fixedpoint import MICROVOLTS, MILLIVOLTS, FixedScale
+
+
+@pytest.mark.parametrize("bits", (10, 12, 14, 16))
+@pytest.mark.parametrize("reference_voltage", (1.0, 3.3, 5.0, 5.5))
+@pytest.mark.parametrize("units", (MILLIVOLTS, MICROVOLTS))
+def test_error_bound(bits, reference_voltage, units):
+    scale = FixedScale(bits, reference_voltage, units)
+    full_scale = (1 << bits) - 1
+    reference = round(reference_voltage * units)
+    assert scale.max_error < (3 if bits == 16 else 1)
+    for code in [*range(0, full_scale, 7), full_scale]:
+        # Every intermediate stays a CircuitPython small int.
+        assert code * scale.multiplier + scale.rounding < 1 << 30
+        exact = code * reference / full_scale
+        assert abs(scale.convert(code) - exact) <= scale.max_error
+
+
+def test_convert_into_matches_convert():
+    scale = FixedScale(16, 5.5, MICROVOLTS)
+    codes = [0, 1, 12345, 65535]
+    assert list(scale.convert_into(codes)) == [scale.convert(code) for code in codes]
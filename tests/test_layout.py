@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Command frames and result decoding of every chip, spelled out byte by byte."""
+
+import pytest
+
+from adafruit_mcp3xxx import decode
+from adafruit_mcp3xxx.layout import FrameLayout
+from adafruit_mcp3xxx.mcp3002 import MCP3002
+from adafruit_mcp3xxx.mcp3004 import MCP3004
+from adafruit_mcp3xxx.mcp3008 import MCP3008
+from adafruit_mcp3xxx.mcp3202 import MCP3202
+from adafruit_mcp3xxx.mcp3204 import MCP3204
+from adafruit_mcp3xxx.mcp3208 import MCP3208
+
+# Datasheet command frames, indexed by pin: (single-ended, differential).
+FRAMES = {
+    # Start bit last in byte 0, then SGL/DIFF, D2, D1, D0.
+    MCP3008: (
+        ["018000", "019000", "01a000", "01b000", "01c000", "01d000", "01e000", "01f000"],
+        ["010000", "011000", "012000", "013000", "014000", "015000", "016000", "017000"],
+    ),
+    MCP3004: (
+        ["018000", "019000", "01a000", "01b000"],
+        ["010000", "011000", "012000", "013000"],
+    ),
+    # Start bit, SGL/DIFF, ODD/SIGN and MSBF in one byte.
+    MCP3002: (["6000", "7000"], ["4000", "5000"]),
+    # Start bit last in byte 0, then SGL/DIFF, ODD/SIGN and MSBF in byte 1.
+    MCP3202: (["018000", "01c000"], ["010000", "014000"]),
+    # Start bit, SGL/DIFF and D2 end byte 0, D1 and D0 start byte 1.
+    MCP3204: (
+        ["060000", "064000", "068000", "06c000"],
+        ["040000", "044000", "048000", "04c000"],
+    ),
+    MCP3208: (
+        ["060000", "064000", "068000", "06c000", "070000", "074000", "078000", "07c000"],
+        ["040000", "044000", "048000", "04c000", "050000", "054000", "058000", "05c000"],
+    ),
+}
+
+# A received frame with every bit outside the result set, and the code it holds.
+RESPONSES = {
+    MCP3008: ("fffeab", 0x2AB),
+    MCP3004: ("fffeab", 0x2AB),
+    MCP3002: ("feab", 0x2AB),
+    MCP3202: ("fffabc", 0xABC),
+    MCP3204: ("fff5a5", 0x5A5),
+    MCP3208: ("fff5a5", 0x5A5),
+}
+
+
+def hexes(frames):
+    return [bytes(frame).hex() for frame in frames]
+
+
+@pytest.mark.parametrize("chip_class", FRAMES, ids=lambda chip_class: chip_class.__name__)
+def test_command_frames(emulate, chip_class):
+    mcp, _ = emulate(chip_class)
+    single_ended, differential = FRAMES[chip_class]
+    pins = range(chip_class.CHANNELS)
+    assert hexes(mcp.command(pin) for pin in pins) == single_ended
+    assert hexes(mcp.command(pin, True) for pin in pins) == differential
+    assert mcp.pack_commands(pins).hex() == "".join(single_ended)
+
+
+@pytest.mark.parametrize("chip_class", RESPONSES, ids=lambda chip_class: chip_class.__name__)
+def test_decode(emulate, chip_class):
+    mcp, _ = emulate(chip_class)
+    response, code = RESPONSES[chip_class]
+    frame = bytearray.fromhex(response)
+    assert mcp._decode(frame) == code
+    assert list(decode.decode_frames(mcp, frame * 3)) == [code] * 3
+
+
+def test_layout_must_fit_the_result():
+    # The MCP3008's three channel bits do not fit ahead of 12 bits in two bytes, and
+    # the MCP3202's single channel bit cannot select four inputs.
+    assert FrameLayout(2, 1, 1).compile(10, 2)[1:] == (0, 0x03)
+    with pytest.raises(ValueError):
+        FrameLayout(2, 1, 3).compile(12, 8)
+    with pytest.raises(ValueError):
+        FrameLayout(3, 7, 1).compile(12, 4)
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Block timing of the sample pipeline and the scheduler feeding it."""
+
+import time
+
+import pytest
+
+from adafruit_mcp3xxx.mcp3008 import MCP3008
+from adafruit_mcp3xxx.pipeline import decimate, source, to_volts
+from adafruit_mcp3xxx.scheduler import SampleScheduler
+
+RATE = 200
+FRAMES = 10
+BLOCK_NS = FRAMES * 1_000_000_000 // RATE
+CONSUMER_S = 0.03
+
+
+def test_scheduler_blocks_absorb_consumer_time(emulate):
+    mcp, _ = emulate(MCP3008)
+    scheduler = SampleScheduler(mcp, (0, 1), RATE)
+    starts = []
+    for block in scheduler.blocks(FRAMES, count=6):
+        starts.append(block.timestamp_ns)
+        time.sleep(CONSUMER_S)
+    # Only the first block starts on time; later ones start by catching up.
+    spacing = (starts[-1] - starts[1]) / (len(starts) - 2)
+    assert spacing == pytest.approx(BLOCK_NS, rel=0.1)
+    assert scheduler.stats.missed == 0
+
+
+def test_scheduler_blocks_count_overrun_deadlines(emulate):
+    mcp, _ = emulate(MCP3008)
+    scheduler = SampleScheduler(mcp, (0,), RATE)
+    for _ in scheduler.blocks(FRAMES, count=3):
+        # Longer than a whole block, so some deadlines cannot be caught up.
+        time.sleep(2 * BLOCK_NS / 1_000_000_000)
+    assert scheduler.stats.missed > 0
+
+
+def test_source_block_spacing(emulate):
+    mcp, _ = emulate(MCP3008)
+    arrivals = []
+    for block in source(mcp, (0, 1), RATE, block=FRAMES, count=6):
+        arrivals.append(time.monotonic_ns())
+        assert len(block) == 2 * FRAMES
+        time.sleep(CONSUMER_S)
+    spacing = (arrivals[-1] - arrivals[0]) / (len(arrivals) - 1)
+    assert spacing == pytest.approx(BLOCK_NS, rel=0.1)
+
+
+def test_decimate_keeps_block_type(emulate):
+    mcp, chip = emulate(MCP3008, inputs=[1.0, 2.0] + [0.0] * 6)
+    codes = next(iter(source(mcp, (0, 1), 1000, block=8, count=1) | decimate(4)))
+    assert codes.typecode == "H"
+    assert list(codes) == [mcp.read(0), mcp.read(1)] * 2
+    volts = next(iter(source(mcp, (0, 1), 1000, block=8, count=1) | to_volts() | decimate(4)))
+    assert volts.typecode == "f"
+    assert list(volts) == pytest.approx([1.0, 2.0] * 2, abs=0.01)
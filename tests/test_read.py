@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Every driver's reads against the datasheet protocol, as modelled by the emulator."""
+
+from array import array
+
+import pytest
+
+from adafruit_mcp3xxx.analog_in import AnalogIn
+from adafruit_mcp3xxx.mcp3202 import MCP3202
+
+
+def expected_code(mcp, chip, positive, negative=None):
+    volts = chip.voltage(positive)
+    if negative is not None:
+        volts -= chip.voltage(negative)
+    full_scale = 1 << mcp.BITS
+    return min(max(int(volts * full_scale / chip.ref_voltage), 0), full_scale - 1)
+
+
+def test_read_single_ended(emulated):
+    mcp, chip = emulated
+    for pin in range(mcp.CHANNELS):
+        assert mcp.read(pin) == expected_code(mcp, chip, pin)
+
+
+def test_read_differential(emulated):
+    mcp, chip = emulated
+    for (positive, negative), setting in mcp.DIFF_PINS.items():
+        assert mcp.read(setting, is_differential=True) == expected_code(
+            mcp, chip, positive, negative
+        )
+
+
+def test_analog_in_differential(emulated):
+    mcp, chip = emulated
+    for positive, negative in mcp.DIFF_PINS:
+        code = expected_code(mcp, chip, positive, negative)
+        assert AnalogIn(mcp, positive, negative).value >> (16 - mcp.BITS) == code
+
+
+def test_bulk_paths_match_read(emulated):
+    mcp, _ = emulated
+    pins = range(mcp.CHANNELS)
+    expected = [mcp.read(pin) for pin in pins]
+    assert list(mcp.scan()) == expected
+    assert list(mcp.read_many(pins)) == expected
+    assert list(mcp.read_packed(mcp.pack_commands(pins))) == expected
+    assert list(mcp.read_into(1, array("H", bytes(8)))) == [expected[1]] * 4
+
+
+def test_mcp3202_full_resolution(emulate):
+    # The MCP3202 once sent a 2-byte frame, which only had room for B11..B2 and
+    # returned a quarter of the true code.
+    mcp, _ = emulate(MCP3202, inputs=[2.0, 1.0])
+    assert mcp.read(0) == 2482
+    assert mcp.read(1) == 1241
+    assert mcp.read(0, is_differential=True) == 1241
+
+
+@pytest.mark.parametrize("pin", (-1, "channels"))
+def test_pin_out_of_range(emulated, pin):
+    mcp, _ = emulated
+    if pin == "channels":
+        pin = mcp.CHANNELS
+    for is_differential in (False, True):
+        with pytest.raises(ValueError):
+            mcp.read(pin, is_differential)
+        with pytest.raises(ValueError):
+            mcp.command(pin, is_differential)
+        with pytest.raises(ValueError):
+            mcp.read_many((0, pin), is_differential=is_differential)
+        with pytest.raises(ValueError):
+            mcp.read_into(pin, array("H", bytes(4)), is_differential=is_differential)
+        with pytest.raises(ValueError):
+            mcp.pack_commands((pin,), is_differential)
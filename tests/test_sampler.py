@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Ring buffer overruns, including a producer lapping the consumer mid-copy."""
+
+from array import array
+
+from adafruit_mcp3xxx.sampler import RingBuffer
+
+
+def fill(ring, values):
+    for value in values:
+        ring.write(array("H", [value, value + 100]))
+
+
+class LappingBuffer(list):
+    """Consumer buffer whose first write lets the producer append more frames, as if
+    the producer thread ran in the middle of `RingBuffer.read_into`."""
+
+    def __init__(self, ring, size, values):
+        super().__init__([0] * size)
+        self._ring = ring
+        self._values = values
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        values, self._values = self._values, ()
+        fill(self._ring, values)
+
+
+def test_read_in_order():
+    ring = RingBuffer(4, 2)
+    fill(ring, (1, 2, 3))
+    buf = array("H", bytes(2 * 2 * 2))
+    assert ring.read_into(buf) == 2
+    assert list(buf) == [1, 101, 2, 102]
+    assert ring.read_into(buf) == 1
+    assert list(buf[:2]) == [3, 103]
+    assert ring.read_into(buf) == 0
+    assert ring.overruns == 0
+
+
+def test_overrun_before_read():
+    ring = RingBuffer(4, 2)
+    fill(ring, range(6))
+    buf = array("H", bytes(2 * 2 * 8))
+    assert ring.available == 4
+    assert ring.read_into(buf) == 4
+    assert list(buf[::2][:4]) == [2, 3, 4, 5]
+    assert ring.overruns == 2
+
+
+def test_producer_laps_consumer_during_copy():
+    ring = RingBuffer(4, 2)
+    fill(ring, range(4))
+    # Frames 4 and 5 land in the slots of frames 0 and 1 while frame 0 is being copied.
+    buf = LappingBuffer(ring, 2 * 4, (4, 5))
+    count = ring.read_into(buf)
+    # Frame 1 may have been overwritten before it was copied, so both are dropped.
+    assert count == 2
+    assert buf[: 2 * count] == [2, 102, 3, 103]
+    assert ring.overruns == 2
+    rest = array("H", bytes(2 * 2 * 4))
+    assert ring.read_into(rest) == 2
+    assert list(rest[:4]) == [4, 104, 5, 105]
+    assert ring.overruns == 2
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Shared-memory server and client in one process."""
+
+import os
+import threading
+from array import array
+
+from adafruit_mcp3xxx.emulator import EmulatedMCP3xxx, EmulatedSPI
+from adafruit_mcp3xxx.mcp3008 import MCP3008
+from adafruit_mcp3xxx.server import AcquisitionServer, SampleClient, SharedBus
+
+
+def test_client_reads_server_frames(emulate):
+    mcp, _ = emulate(MCP3008, inputs=[1.0, 2.0] + [0.0] * 6)
+    name = f"mcp3xxx-test-{os.getpid()}"
+    with AcquisitionServer(mcp, (0, 1), 1000, name=name, capacity=64) as server:
+        with SampleClient(name) as client:
+            server.serve(10)
+            frames = array("H", bytes(2 * 2 * 16))
+            timestamps = array("q", bytes(8 * 16))
+            assert client.read_into(frames, timestamps) == 10
+            assert list(frames[:4]) == [mcp.read(0), mcp.read(1)] * 2
+            assert timestamps[1] > timestamps[0]
+            assert client.overruns == 0
+
+
+def test_shared_bus_locks_across_threads():
+    bus = SharedBus(EmulatedSPI())
+    assert bus.try_lock()
+    taken = []
+    thread = threading.Thread(target=lambda: taken.append(bus.try_lock()))
+    thread.start()
+    thread.join()
+    assert taken == [False]
+    bus.unlock()
+    assert bus.try_lock()
+    bus.unlock()
+
+
+def test_chips_served_from_threads():
+    spi = EmulatedSPI()
+    bus = SharedBus(spi)
+    chips = [
+        EmulatedMCP3xxx(spi, MCP3008, inputs=[0.5 * (chip + 1)] * 8, ref_voltage=3.3)
+        for chip in range(2)
+    ]
+    mcps = [MCP3008(bus, chip.chip_select, 3.3) for chip in chips]
+    expected = [mcp.read(0) for mcp in mcps]
+    servers = [
+        AcquisitionServer(mcp, (0, 1), 2000, name=f"mcp3xxx-test-{os.getpid()}-{number}")
+        for number, mcp in enumerate(mcps)
+    ]
+    try:
+        threads = [threading.Thread(target=server.serve, args=(200,)) for server in servers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for server, code in zip(servers, expected):
+            with SampleClient(server.name) as client:
+                client._tail = 0
+                frames = array("H", bytes(2 * 2 * 200))
+                assert client.read_into(frames) == 200
+                assert set(frames) == {code}
+    finally:
+        for server in servers:
+            server.close()
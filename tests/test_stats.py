@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Bus instrumentation switched on and off."""
+
+from adafruit_mcp3xxx.emulator import EmulatedMCP3xxx, EmulatedSPI
+from adafruit_mcp3xxx.mcp3xxx_array import MCP3xxxArray
+from adafruit_mcp3xxx.mcp3008 import MCP3008
+
+
+def test_stats_count_reads(emulate):
+    mcp, _ = emulate(MCP3008)
+    code = mcp.read(2)
+    stats = mcp.enable_stats()
+    assert mcp.read(2) == code
+    mcp.read_many((0, 1, 2))
+    assert stats.transactions == 2
+    assert stats.transfers == 4
+    assert stats.channel_reads == {(2, False): 2, (0, False): 1, (1, False): 1}
+    assert stats.lock_wait_ns >= 0
+    assert stats.setup_ns >= 0
+    assert stats.busy_ns >= stats.lock_wait_ns + stats.setup_ns
+    assert sum(stats.latency_histogram) == 2
+
+
+def test_disable_restores_the_device(emulate):
+    mcp, _ = emulate(MCP3008)
+    device = mcp._spi_device
+    spi = device.spi
+    mcp.enable_stats()
+    assert mcp._spi_device.spi is spi
+    mcp.disable_stats()
+    assert mcp._spi_device is device
+    assert device.spi is spi
+    assert mcp.stats is None
+
+
+def test_array_accepts_instrumented_chips():
+    spi = EmulatedSPI()
+    first, second = (MCP3008(spi, EmulatedMCP3xxx(spi, MCP3008).chip_select, 3.3) for _ in range(2))
+    stats = first.enable_stats()
+    MCP3xxxArray((first, second)).scan()
+    assert stats.transfers == 8
+    assert stats.transactions == 1
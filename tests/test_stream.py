@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Sample blocks streamed over loopback UDP."""
+
+import time
+
+import pytest
+
+from adafruit_mcp3xxx.mcp3208 import MCP3208
+from adafruit_mcp3xxx.scheduler import SampleScheduler
+from adafruit_mcp3xxx.stream import UDPReceiver, UDPSender, decode_block, encode_block, stream
+
+
+@pytest.fixture
+def scheduler(emulate):
+    mcp, _ = emulate(MCP3208, inputs=[1.0, 2.0] + [0.0] * 6)
+    return SampleScheduler(mcp, (1, 0), 100)
+
+
+@pytest.mark.parametrize("host", ("", "localhost", "127.0.0.1"))
+def test_unicast_bind(host):
+    with UDPReceiver((host, 0)) as receiver:
+        assert receiver.address[1]
+
+
+def test_receive_blocks(scheduler):
+    with UDPReceiver(("127.0.0.1", 0)) as receiver, UDPSender(
+        receiver.address, "MCP3208"
+    ) as sender:
+        stream(scheduler, sender, frames=4, count=2)
+        sender.sequence += 3
+        stream(scheduler, sender, frames=4, count=1)
+        received = [receiver.receive(1) for _ in range(3)]
+    assert [sequence for sequence, _ in received] == [0, 1, 5]
+    assert receiver.chip == "MCP3208"
+    assert receiver.missed == 3
+    block = received[0][1]
+    assert block.channels == (1, 0)
+    assert list(block.data[:2]) == [2482, 1241]
+
+
+def test_restarted_sender_is_followed(scheduler):
+    with UDPReceiver(("127.0.0.1", 0)) as receiver:
+        with UDPSender(receiver.address) as sender:
+            stream(scheduler, sender, frames=2, count=3)
+        with UDPSender(receiver.address) as sender:
+            stream(scheduler, sender, frames=2, count=2)
+        sequences = [receiver.receive(1)[0] for _ in range(5)]
+    assert sequences == [0, 1, 2, 0, 1]
+    assert receiver.restarts == 1
+    assert receiver.late == 0
+    assert receiver.missed == 0
+
+
+class SlowSender:
+    """Takes 20 ms to send each block."""
+
+    def __init__(self):
+        self.starts = []
+
+    def send(self, block):
+        self.starts.append(block.timestamp_ns)
+        time.sleep(0.02)
+
+
+def test_stream_keeps_the_schedule(scheduler):
+    sender = SlowSender()
+    stream(scheduler, sender, frames=5, count=6)
+    # Only the first block starts on time; later ones start by catching up.
+    spacing = (sender.starts[-1] - sender.starts[1]) / (len(sender.starts) - 2)
+    assert spacing == pytest.approx(50_000_000, rel=0.1)
+    assert scheduler.stats.missed == 0
+
+
+def test_garbage_is_skipped(scheduler):
+    with UDPReceiver(("127.0.0.1", 0)) as receiver, UDPSender(receiver.address) as sender:
+        sender._socket.sendto(b"hello", receiver.address)
+        # A block header with the right magic and version, cut short.
+        sender._socket.sendto(encode_block(next(scheduler.blocks(2)), 0)[:-1], receiver.address)
+        stream(scheduler, sender, frames=2, count=1)
+        sequence, block = receiver.receive(1)
+    assert sequence == 0
+    assert block.frames == 2
+    assert receiver.invalid == 2
+    assert receiver.restarts == 0
+
+
+def test_truncated_block_is_rejected(scheduler):
+    packet = encode_block(next(scheduler.blocks(2)), 7, "MCP3208", 1)
+    assert decode_block(packet)[:3] == (1, 7, "MCP3208")
+    for size in (5, len(packet) - 1):
+        with pytest.raises(ValueError):
+            decode_block(packet[:size])
+
+
+def test_timeout():
+    with UDPReceiver(("127.0.0.1", 0)) as receiver, pytest.raises(TimeoutError):
+        receiver.receive(0.01)